@@ -1,11 +1,21 @@
-import json
+try:
+    import orjson as json_loader
+except ImportError:
+    # stdlib json parses the same files, just slower
+    import json as json_loader
+import sys
 import time
 import os
-import openai
-from openai import OpenAIError
+import re
+import hashlib
 import threading
-from difflib import get_close_matches
-import pyzipper
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from rapidfuzz import fuzz, process
+
+# openai (httpx/pydantic) and pyzipper (cryptography) are heavy imports;
+# they are pulled in lazily inside the methods that actually need them
+# so startup without Morpheus/GPT stays cheap.
 
 class AIEngine:
     """
@@ -36,6 +46,15 @@ class AIEngine:
             Password (bytes or str) to decrypt that .zip
         """
         self.console = console
+        # Memoized log kwargs => the hot log paths skip rebuilding the
+        # same tag/color dict on every call (see _say/_say_err).
+        self._seraph_kw = dict(tag="seraph", color="#FFFF55")
+        self._operator_kw = dict(tag="operator", color="#00FF00")
+        self._err_kw = dict(tag="seraph", color="#FF0000")
+        # Guarantee the flag exists => the query hot path can use a plain
+        # attribute load instead of getattr with a default.
+        if not hasattr(console, "morpheus_unlocked"):
+            console.morpheus_unlocked = False
         self.config_file = config_file
         self.morpheus_wallet_zip_path = morpheus_wallet_zip_path
 
@@ -55,6 +74,21 @@ class AIEngine:
             for item in cmd_map.get("commands", [])
         }
 
+        # Inverted synonym => canonical command index for O(1) exact hits,
+        # plus the key list rapidfuzz scans for near-matches. Keys are
+        # lowercased and interned once => hits reduce to pointer compares.
+        self._cmd_index = {
+            sys.intern(syn.lower()): cmd
+            for cmd, syns in self.commands.items()
+            for syn in [cmd, *syns]
+        }
+        self._syn_list = list(self._cmd_index)
+
+        # Small LRU over fuzzy lookups => retyped queries skip rapidfuzz.
+        # (Rebuilt implicitly with the engine whenever config is reloaded.)
+        self._lookup_cache = OrderedDict()
+        self._lookup_cache_max = 256
+
         # Simple responses
         self.acknowledgments = cmd_map.get("acknowledgments", [])
         self.greetings = cmd_map.get("greetings", [])
@@ -65,45 +99,123 @@ class AIEngine:
         self.rules = self.config_data.get("RULES", {})
         self.settings = self.config_data.get("SETTINGS", {})
 
+        # Precompiled normalization state => str.translate runs the whole
+        # punctuation strip in C instead of a per-character Python loop.
+        norm_settings = self.settings.get("input_normalization", {})
+        self._lower_inputs = norm_settings.get("lowercase_inputs", True)
+        if norm_settings.get("remove_punctuation", True):
+            self._del_table = str.maketrans('', '', ''.join(
+                c for c in map(chr, range(128))
+                if not (c.isalnum() or c.isspace() or c in ":\\/.-")
+            ))
+        else:
+            self._del_table = None
+
+        # Hoist remaining per-query settings/collections => plain attribute
+        # reads and O(1) set membership on the respond_to_query hot path.
+        self._max_hist = self.settings.get("max_gpt_history", 10)
+        self._fuzzy_cutoff = self.settings.get("fuzzy_cutoff", 90)
+        self._greetings = frozenset(sys.intern(s.lower()) for s in self.greetings)
+        self._farewells = frozenset(sys.intern(s.lower()) for s in self.farewells)
+        self._acks = frozenset(sys.intern(s.lower()) for s in self.acknowledgments)
+
+        # Union of every exact token (config entries are pre-lowercased)
+        # => respond_to_query can skip normalization for the common case
+        self._all_exact = frozenset().union(
+            self._greetings, self._farewells, self._acks, self._cmd_index
+        )
+
         # GPT usage
         self.openai_api_key = None
+        # Cached openai.OpenAI client => keep-alive connection reuse;
+        # rebuilt lazily whenever the API key rotates.
+        self._openai_client = None
         self.twitter_keys = {}
 
+        # Cache of decrypted api_keys.txt bytes, keyed by
+        # (zip path, mtime_ns, size, password hash) so a recheck with an
+        # unchanged zip skips the PBKDF2 stretch + AES decrypt entirely.
+        self._api_key_cache = {}
+
         # Attempt initial load of GPT key if .zip path/password are already known
         self.load_api_keys_from_morpheus()
 
         # AIEngine states
         self.last_activity_time = time.time()
         self.current_context = None
-        self.command_in_progress = False
+        # Guards dispatch atomically; a boolean check-then-set races when
+        # the console and background threads both call respond_to_query.
+        self._busy_lock = threading.Lock()
+
+        # GPT system prompt built once instead of a fresh dict per call
+        self._system_msg = {
+            "role": "system",
+            "content": "You are Seraph, an advanced AI from the Matrix, guiding NEO calmly."
+        }
+
+        # Keep a conversation for GPT fallback; maxlen auto-evicts the
+        # oldest entry in O(1) instead of list.pop(0) shifting everything.
+        self.conversation_history = deque(maxlen=self._max_hist)
+        self._history_lock = threading.Lock()
+
+        # GPT round-trips run on this pool so the console thread never
+        # blocks on the OpenAI HTTP call.
+        self._gpt_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="seraph-gpt")
 
-        # Keep a conversation for GPT fallback
-        self.conversation_history = []
+    def _say(self, msg):
+        """Log a SERAPH line with the standard tag/color."""
+        self.console.log("SERAPH: " + msg, **self._seraph_kw)
+
+    def _say_err(self, msg):
+        """Log a SERAPH error line (red)."""
+        self.console.log("SERAPH: " + msg, **self._err_kw)
 
     def load_config(self, config_file):
         """Load JSON from disk, handle missing or parse errors gracefully."""
         if os.path.exists(config_file):
             try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except json.JSONDecodeError as e:
-                self.console.log(
-                    f"SERAPH: Error parsing config file: {e}",
-                    tag="seraph",
-                    color="#FFFF55"
-                )
+                # orjson parses raw bytes directly (no text decode pass)
+                with open(config_file, 'rb') as f:
+                    return json_loader.loads(f.read())
+            except ValueError as e:
+                self._say(f"Error parsing config file: {e}")
                 return {}
         else:
-            self.console.log(
-                f"SERAPH: Config file not found: {config_file}",
-                tag="seraph",
-                color="#FFFF55"
-            )
+            self._say(f"Config file not found: {config_file}")
             return {}
 
+    def _read_api_keys_bytes(self):
+        """
+        Read 'api_keys.txt' bytes from the Morpheus zip, with caching.
+
+        The cache key is (zip path, mtime_ns, size, sha256 of password) so
+        the expensive PBKDF2 + AES decrypt only happens when the zip (or
+        password) actually changed. Returns bytes or None if not present.
+        """
+        import pyzipper
+
+        st = os.stat(self.morpheus_wallet_zip_path)
+        pwd_hash = hashlib.sha256(self.morpheus_wallet_zip_password).hexdigest()
+        cache_key = (self.morpheus_wallet_zip_path, st.st_mtime_ns, st.st_size, pwd_hash)
+
+        if cache_key in self._api_key_cache:
+            return self._api_key_cache[cache_key]
+
+        with pyzipper.AESZipFile(self.morpheus_wallet_zip_path, 'r',
+                                 encryption=pyzipper.WZ_AES) as zf:
+            zf.setpassword(self.morpheus_wallet_zip_password)
+            if "api_keys.txt" in zf.namelist():
+                data = zf.read("api_keys.txt")
+            else:
+                # The user requested no lines for missing 'api_keys.txt'
+                data = None
+
+        self._api_key_cache = {cache_key: data}  # keep only the latest entry
+        return data
+
     def load_api_keys_from_morpheus(self):
         """
-        Attempt to read 'api_keys.txt' from Morpheus zip. 
+        Attempt to read 'api_keys.txt' from Morpheus zip.
         If 'ChatGPT API Key:' is found, set self.openai_api_key & openai.api_key.
         """
         if not self.morpheus_wallet_zip_path or not self.morpheus_wallet_zip_password:
@@ -111,62 +223,46 @@ class AIEngine:
             return
 
         try:
-            with pyzipper.AESZipFile(self.morpheus_wallet_zip_path, 'r',
-                                     encryption=pyzipper.WZ_AES) as zf:
-                zf.setpassword(self.morpheus_wallet_zip_password)
-                if "api_keys.txt" in zf.namelist():
-                    data = zf.read("api_keys.txt").decode("utf-8")
-                    self._parse_api_keys(data)
-                else:
-                    # The user requested no lines for missing 'api_keys.txt'
-                    pass
+            data = self._read_api_keys_bytes()
+            if data is not None:
+                self._parse_api_keys(data)
         except Exception as e:
-            self.console.log(
-                f"SERAPH: Error reading API keys from Morpheus zip: {e}",
-                tag="seraph",
-                color="#FF0000"
-            )
+            self._say_err(f"Error reading API keys from Morpheus zip: {e}")
 
     def recheck_api_keys(self):
         """
-        After user fully unlocks Morpheus, call this again 
+        After user fully unlocks Morpheus, call this again
         so we definitely parse 'api_keys.txt' with the known .zip & pass.
+        The cached bytes are reused when the zip hasn't changed on disk.
         """
         if not self.morpheus_wallet_zip_path or not self.morpheus_wallet_zip_password:
             # The user requested no lines about skipping re-check if missing
             return
 
         try:
-            with pyzipper.AESZipFile(self.morpheus_wallet_zip_path, 'r',
-                                     encryption=pyzipper.WZ_AES) as zf:
-                zf.setpassword(self.morpheus_wallet_zip_password)
-                if "api_keys.txt" in zf.namelist():
-                    data = zf.read("api_keys.txt").decode("utf-8")
-                    self._parse_api_keys(data)
-                else:
-                    # user doesn't want logs about missing 'api_keys.txt'
-                    pass
+            data = self._read_api_keys_bytes()
+            if data is not None:
+                self._parse_api_keys(data)
         except Exception as e:
-            self.console.log(
-                f"SERAPH: Error re-checking keys from Morpheus zip: {e}",
-                tag="seraph",
-                color="#FF0000"
-            )
+            self._say_err(f"Error re-checking keys from Morpheus zip: {e}")
+
+    # Captures "key: value" pairs in one compiled pass over the raw bytes
+    _KEY_RE = re.compile(rb'^\s*([^:\n]+?)\s*:\s*(.+?)\s*$', re.M)
 
-    def _parse_api_keys(self, raw_text):
+    def _parse_api_keys(self, raw):
         """
-        Given the raw text of 'api_keys.txt', parse lines for 'ChatGPT API Key:' etc.
+        Given the raw bytes of 'api_keys.txt', parse lines for 'ChatGPT API Key:' etc.
+        Works on bytes directly so the whole file is never decoded to str.
         """
-        for line in raw_text.splitlines():
-            if ":" in line:
-                key, val = line.split(":", 1)
-                k = key.strip().lower()
-                v = val.strip()
-                if k == "chatgpt api key":
-                    self.openai_api_key = v
-                    openai.api_key = v  # set globally
-                elif k.startswith("twitter "):
-                    self.twitter_keys[k] = v
+        for m in self._KEY_RE.finditer(raw):
+            k = m.group(1).lower()
+            if k == b"chatgpt api key":
+                v = m.group(2).decode("utf-8")
+                if v != self.openai_api_key:
+                    self._openai_client = None  # key rotated => rebuild client
+                self.openai_api_key = v
+            elif k.startswith(b"twitter "):
+                self.twitter_keys[k.decode("utf-8")] = m.group(2).decode("utf-8")
 
     # ---------------------------------------------------------------------
     # The main "respond_to_query" - user text
@@ -177,12 +273,17 @@ class AIEngine:
         2) If recognized KeyMaker command => pass to console
         3) Otherwise => if console.morpheus_unlocked => GPT fallback (if key), else offline message
         """
-        if self.command_in_progress:
+        if not self._busy_lock.acquire(blocking=False):
             return
-        self.command_in_progress = True
 
         try:
-            user_input = self.normalize_input(user_input)
+            # Fast path: already-canonical input (the common interactive
+            # case) skips the punctuation-strip pass entirely.
+            stripped = user_input.strip().lower()
+            if stripped in self._all_exact:
+                user_input = stripped
+            else:
+                user_input = self.normalize_input(user_input)
 
             # 1) Check simple (greetings, farewells, etc.)
             if self.check_simple_responses(user_input):
@@ -191,34 +292,30 @@ class AIEngine:
             # 2) Check KeyMaker command
             recognized_cmd = self.is_predefined_command(user_input)
             if recognized_cmd:
-                self.console.log(
-                    f"SERAPH: Executing predefined command: {recognized_cmd}",
-                    tag="seraph",
-                    color="#FFFF55"
-                )
+                self._say(f"Executing predefined command: {recognized_cmd}")
                 self.console.handle_ai_command(recognized_cmd)
                 return
 
             # 3) Not recognized => check Morpheus
-            if not getattr(self.console, "morpheus_unlocked", False):
+            if not self.console.morpheus_unlocked:
                 self.console.log(
                     "OPERATOR: Seraph is offline until Morpheus wallet is connected // Command not recognized",
-                    tag="operator",
-                    color="#00FF00"
+                    **self._operator_kw
                 )
                 return
 
-            # If unlocked => GPT fallback
+            # If unlocked => GPT fallback (async; runs on the worker pool,
+            # so the lock is safe to release as soon as it is submitted)
             self.gpt_fallback(user_input)
 
         finally:
-            self.command_in_progress = False
+            self._busy_lock.release()
 
     def normalize_input(self, text):
         """Remove punctuation, force lowercase, etc., if configured."""
-        if self.settings.get("input_normalization", {}).get("remove_punctuation", True):
-            text = ''.join(c for c in text if c.isalnum() or c.isspace() or c in ":\\/.-")
-        if self.settings.get("input_normalization", {}).get("lowercase_inputs", True):
+        if self._del_table is not None:
+            text = text.translate(self._del_table)
+        if self._lower_inputs:
             text = text.lower()
         return text.strip()
 
@@ -226,29 +323,45 @@ class AIEngine:
         """
         If text in greetings/farewells/ack => short SERAPH message
         """
-        if text in self.greetings:
-            greet_msg = self.responses.get("greeting", "Hello there! How can I assist?")
-            self.console.log(f"SERAPH: {greet_msg}", tag="seraph", color="#FFFF55")
+        if text in self._greetings:
+            self._say(self.responses.get("greeting", "Hello there! How can I assist?"))
             return True
 
-        if text in self.farewells:
-            bye_msg = self.responses.get("farewell", "Goodbye! Feel free to return anytime.")
-            self.console.log(f"SERAPH: {bye_msg}", tag="seraph", color="#FFFF55")
+        if text in self._farewells:
+            self._say(self.responses.get("farewell", "Goodbye! Feel free to return anytime."))
             return True
 
-        if text in self.acknowledgments:
-            ack_msg = self.responses.get("acknowledgment", "You're welcome! Any other instructions?")
-            self.console.log(f"SERAPH: {ack_msg}", tag="seraph", color="#FFFF55")
+        if text in self._acks:
+            self._say(self.responses.get("acknowledgment", "You're welcome! Any other instructions?"))
             return True
 
         return False
 
     def is_predefined_command(self, text):
         """If user_input matches a KeyMaker command or synonyms => return that command."""
-        for cmd, synonyms in self.commands.items():
-            if text == cmd or text in synonyms:
-                return cmd
-        return None
+        # Exact lookup first => one hashed dict probe
+        cmd = self._cmd_index.get(text)
+        if cmd is not None:
+            return cmd
+
+        # LRU hit => skip the rapidfuzz scan for repeated queries
+        if text in self._lookup_cache:
+            self._lookup_cache.move_to_end(text)
+            return self._lookup_cache[text]
+
+        # Fuzzy match => token_set_ratio copes with reordered/duplicate words
+        hit = process.extractOne(
+            text,
+            self._syn_list,
+            scorer=fuzz.token_set_ratio,
+            score_cutoff=self._fuzzy_cutoff
+        )
+        cmd = self._cmd_index[hit[0]] if hit else None
+
+        self._lookup_cache[text] = cmd
+        if len(self._lookup_cache) > self._lookup_cache_max:
+            self._lookup_cache.popitem(last=False)
+        return cmd
 
     def gpt_fallback(self, user_input):
         """
@@ -256,46 +369,76 @@ class AIEngine:
         Otherwise => "No GPT key" message.
         """
         if not self.openai_api_key:
-            self.console.log(
-                "SERAPH: No GPT-4 API key set; can't provide an intelligent answer.",
-                tag="seraph",
-                color="#FFFF55"
-            )
+            self._say("No GPT-4 API key set; can't provide an intelligent answer.")
             return
 
         self.add_message("user", user_input)
-        reply = self.interact_with_gpt_conversational()
-        self.console.log(f"SERAPH: {reply}", tag="seraph", color="#FFFF55")
-        self.add_message("assistant", reply)
+        fut = self._gpt_pool.submit(self.interact_with_gpt_conversational)
+        fut.add_done_callback(self._on_gpt_reply)
+
+    def _on_gpt_reply(self, future):
+        """Deliver the GPT reply once the worker thread finishes."""
+        try:
+            reply = future.result()
+            self._say(reply)
+            self.add_message("assistant", reply)
+        except Exception as e:
+            self._say_err(f"Unexpected error: {e}")
 
     def add_message(self, role, content):
         """
         Keep a conversation memory for GPT usage
+        (locked => console thread and GPT worker both append here)
         """
-        self.conversation_history.append({"role": role, "content": content})
-        max_hist = self.settings.get("max_gpt_history", 10)
-        if len(self.conversation_history) > max_hist:
-            self.conversation_history.pop(0)
+        with self._history_lock:
+            self.conversation_history.append({"role": role, "content": content})
+
+    def _get_openai_client(self):
+        """
+        Cached openai.OpenAI client (httpx keep-alive, HTTP/2 when the h2
+        package is present) => TLS handshake only on the first GPT call.
+        """
+        if self._openai_client is None:
+            import openai
+            import httpx
+            try:
+                http_client = httpx.Client(http2=True)
+            except ImportError:
+                http_client = None  # no h2 installed => default HTTP/1.1 pool
+            self._openai_client = openai.OpenAI(
+                api_key=self.openai_api_key,
+                http_client=http_client
+            )
+        return self._openai_client
 
     def interact_with_gpt_conversational(self):
-        """Send entire conversation to GPT-4, get a reply."""
+        """
+        Send entire conversation to GPT-4, get a reply.
+        Uses stream=True so tokens arrive (and are buffered) as they are
+        generated instead of waiting on the full response object.
+        """
+        import openai
+
         try:
-            openai.api_key = self.openai_api_key
-            response = openai.ChatCompletion.create(
+            client = self._get_openai_client()
+            messages = [self._system_msg]
+            messages.extend(self.conversation_history)
+            response = client.chat.completions.create(
                 model="gpt-4",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are Seraph, an advanced AI from the Matrix, guiding NEO calmly."
-                    }
-                ] + self.conversation_history,
+                messages=messages,
                 max_tokens=300,
-                temperature=0.7
+                temperature=0.7,
+                stream=True
             )
-            return response["choices"][0]["message"]["content"].strip()
-        except OpenAIError as e:
-            self.console.log(f"SERAPH: OpenAI Error: {str(e)}", tag="seraph", color="#FF0000")
+            parts = []
+            for chunk in response:
+                piece = chunk.choices[0].delta.content if chunk.choices else None
+                if piece:
+                    parts.append(piece)
+            return "".join(parts).strip()
+        except openai.OpenAIError as e:
+            self._say_err(f"OpenAI Error: {e}")
             return "I encountered an OpenAI error. Please try again later."
         except Exception as e:
-            self.console.log(f"SERAPH: Unexpected error: {str(e)}", tag="seraph", color="#FF0000")
+            self._say_err(f"Unexpected error: {e}")
             return "I encountered an unexpected error while calling GPT-4."
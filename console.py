@@ -1,20 +1,57 @@
 import os
 import tkinter as tk
-from tkinter import filedialog
 from threading import Thread
-from queue import Queue
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue, Empty
 from datetime import datetime
-from difflib import get_close_matches
-import subprocess
-import sys
+import itertools
 import re
+import selectors
+import time
+
+# Progress bars are built by slicing these constants (no per-tick loop)
+_BAR_FULL = "##########"
+_BAR_EMPTY = "          "
+_SPINNER_CHARS = ('/', '-', '\\', '|')
+
+# One sweep over the whole 'list asset' response instead of per-line split
+_GAS_RE = re.compile(r'(?i)\bgas:\s*([\d.]+)')
+
+# One sweep over the whole CLI response for bad-password detection
+_WRONG_PW_RE = re.compile(r'(?i)wrong password|invalid password')
+
+# Same treatment for leftover open-wallet prompts
+_LEFTOVER_RE = re.compile(r'(?i)neo> password:|you have to open the wallet first')
+
+# Recognized CLI command prefixes for Flow 1 (C-level tuple startswith)
+_CLI_PREFIXES = (
+    "open wallet",
+    "close wallet",
+    "list asset",
+    "list address",
+    "show state",
+    "exit",
+    "help",
+    "send",
+    "create wallet"
+)
+
+# Cheap tuple-startswith gate: most subprocess lines are not progress
+# lines at all, so reject them before invoking the regex engine
+_LIR_PREFIXES = ("Downloading:", "Analysing:", "Extracting:", "Processing:")
+
+# Single compiled pass over a LadyInRed progress line =>
+# prefix, integer percent and optional speed in one match
+_LIR_LINE_RE = re.compile(
+    r'^(?P<prefix>Downloading|Analysing|Extracting|Processing):'
+    r'[^%]*?(?P<pct>\d{1,3})%'
+    r'(?:[^\n]*?(?P<speed>[\d.]+(?:B/s|frame/s)))?'
+)
 
-# Matrix aggregator
-from keymaker_dir.matrix import Matrix
-# AI engine (Seraph) - for Flow 2
-from keymaker_dir.ai import AIEngine
 # Wallet creation logic
 from keymaker_dir.wallet import Wallet
+# NOTE: AIEngine (Seraph) is imported lazily in the `seraph` property -
+# it drags openai/httpx along, which slows first-window-shown.
 
 
 class ConsoleWindow:
@@ -59,9 +96,40 @@ class ConsoleWindow:
         # Are we awaiting a CLI password from the user?
         self.cli_password_in_progress = False
 
+        # Short-TTL cache of the last 'list asset' response => repeated
+        # finalize attempts skip the slow CLI round-trip
+        self._list_asset_cache = (None, 0.0)
+
+        # Flat command/synonym => method-name table built once, so
+        # is_local_command is a single dict probe per prompt.
+        self._local_cmd_table = {
+            "create wallets": "request_wallet_creation",
+            "create wallet": "request_wallet_creation",
+            "make wallets": "request_wallet_creation",
+            "export addresses": "export_addresses",
+            "export address": "export_addresses",
+            "export wallet addresses": "export_addresses",
+            "update charts": "handle_update_charts",
+            "refresh charts": "handle_update_charts",
+            "update chart": "handle_update_charts",
+            "installlir": "launch_installLIR",
+            "install lir": "launch_installLIR",
+            "install ladyinred": "launch_installLIR",
+            "install facefusion": "launch_installLIR",
+            "lir": "launch_ladyinred",
+            "ladyinred": "launch_ladyinred",
+            "facefusion": "launch_ladyinred",
+            "faceswap": "launch_ladyinred",
+            "fusion time": "launch_ladyinred",
+        }
+
         # Flag indicating if Morpheus is fully connected => GPT usage allowed
         self.morpheus_unlocked = False
 
+        # Scrollback cap: Tk's Text widget slows down as its internal
+        # B-tree grows, so old lines are trimmed in bulk (see log()).
+        self._max_lines = 2000
+
         # --------------------- CONSOLE TEXT WIDGET -----------------------
         self.text_widget = tk.Text(
             master,
@@ -77,6 +145,10 @@ class ConsoleWindow:
         self.text_widget.place(x=10, y=10)
         self.text_widget.config(state="disabled")
 
+        # Last configured color per tag => tag_configure is only invoked
+        # when a tag's color actually changes, not on every log() call
+        self._configured_tags = {}
+
         # --------------------- PROMPT ENTRY ------------------------------
         self.prompt_var = tk.StringVar()
         self.prompt_entry = tk.Entry(
@@ -100,11 +172,15 @@ class ConsoleWindow:
         )
         self.canvas.place(x=15, y=480)
 
-        self.matrix = Matrix(self.canvas, 500, 300, font_path="F:/KeyMaker/MS_Mincho.ttf")
-        self.start_matrix_animation()
+        # Deferred a tick so first paint isn't blocked on font I/O and
+        # glyph rasterization - the rain can start slightly late
+        self.matrix = None
+        self.master.after(50, self._init_matrix_deferred)
 
         # --------------------- AI ENGINE (Seraph) ------------------------
-        self.seraph = AIEngine(console=self)
+        # Constructed on first access (Flow 2 only) - see the `seraph`
+        # property below.
+        self._seraph = None
 
         # --------------------- LOCAL WALLET ------------------------------
         self.local_wallet = Wallet(self.vault.path, self.vault.password)
@@ -115,11 +191,41 @@ class ConsoleWindow:
         # For capturing the external process (ladyinred) if running
         self.lir_process = None
 
+        # Short background tasks (wallet batches, exports) share one
+        # pool instead of paying thread startup per click; long-running
+        # loops (matrix, pipe reader) keep their own dedicated threads
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="keymaker")
+
+        # One selector-based reader thread reaps stdout from however many
+        # child processes are running (one blocked thread per child before)
+        self._io_selector = selectors.DefaultSelector()
+        self._io_thread = None
+
+        # Progress updates from worker threads are queued and drained on
+        # the Tk thread (Tk is not thread-safe); draining coalesces to the
+        # newest value and is capped at ~30 Hz.
+        self._lir_queue = Queue()
+        self._lir_pending = False
+        self._progress_queue = Queue()
+        self._progress_pending = False
+        self._progress_block_open = False
+        self._see_pending = False
+
         # Track states for LadyInRed progress logic
         self.lir_current_prefix = None
         self.lir_progress_map = {}        # e.g. {"Downloading": 0..100, "Analysing": ..., ...}
-        self.lir_spinners = ['/', '-', '\\', '|']
-        self.lir_spinner_states = {}      # e.g. {"Downloading": 0..3, ...}
+        self.lir_spinner_cycles = {}      # e.g. {"Downloading": cycle('/-\\|'), ...}
+
+    @property
+    def seraph(self):
+        """
+        Lazily construct the AI engine on first use so its import cost
+        (openai, httpx, config parsing) stays off the startup path.
+        """
+        if self._seraph is None:
+            from keymaker_dir.ai import AIEngine
+            self._seraph = AIEngine(console=self)
+        return self._seraph
 
     def set_trinity(self, trinity_instance):
         """
@@ -131,6 +237,11 @@ class ConsoleWindow:
     # ---------------------------------------------------------------------
     # MATRIX ANIMATION
     # ---------------------------------------------------------------------
+    def _init_matrix_deferred(self):
+        from keymaker_dir.matrix import Matrix
+        self.matrix = Matrix(self.canvas, 500, 300, font_path="F:/KeyMaker/MS_Mincho.ttf")
+        self.start_matrix_animation()
+
     def start_matrix_animation(self):
         try:
             t = Thread(target=self.matrix.start, daemon=True)
@@ -152,28 +263,81 @@ class ConsoleWindow:
             self._finalize_morpheus_connection()
             return
 
+        # Only auto-scroll when the user is already at the bottom
+        at_bottom = self.text_widget.yview()[1] >= 0.999
+
         self.text_widget.config(state="normal")
         if tag and color:
-            self.text_widget.tag_configure(tag, foreground=color)
+            if self._configured_tags.get(tag) != color:
+                self.text_widget.tag_configure(tag, foreground=color)
+                self._configured_tags[tag] = color
             self.text_widget.insert("end", message + "\n", tag)
         else:
             self.text_widget.insert("end", message + "\n")
-        self.text_widget.see("end")
+
+        # Bulk-trim scrollback every ~200 lines past the cap so insertion
+        # cost stays O(1) instead of degrading over long sessions
+        end_line = int(self.text_widget.index('end-1c').split('.')[0])
+        if end_line > self._max_lines + 200:
+            self.text_widget.delete('1.0', f'{end_line - self._max_lines}.0')
+
+        # Coalesce burst logging into one see("end") per idle cycle -
+        # every see() forces Tk to compute display-line positions
+        if at_bottom and not self._see_pending:
+            self._see_pending = True
+            self.master.after_idle(self._do_see_end)
         self.text_widget.config(state="disabled")
 
-        # aggregator-based matrix
-        self.matrix.queue_message(message)
+        # aggregator-based matrix (LIR/progress spam is skipped => the
+        # rain doesn't need it and the aggregator stays small)
+        if self.matrix is not None and not message.startswith(("LADY IN RED", "Progress: [")):
+            self.matrix.queue_message(message)
 
         check_line = message.lower().strip()
         if ("operator:" in check_line) and ("provide password." in check_line):
             self.cli_password_in_progress = True
 
-        if ("neo> password:" in check_line or "you have to open the wallet first" in check_line):
+        if _LEFTOVER_RE.search(message):
             if not self.cli_password_in_progress:
                 self.log("OPERATOR: Detected leftover partial open wallet state. Forcing CLI stop.",
                          tag="operator", color="#FF0000")
                 self.force_cli_stop("CLI leftover. Re-click 'Connect Morpheus Wallet' to start fresh.")
 
+    def log_many(self, lines, tag=None, color=None):
+        """
+        Append many lines in ONE widget edit. Unlike log(), this skips
+        the per-message trigger/matrix scans - callers that need those
+        checks do them once over the whole block themselves.
+        """
+        if not lines:
+            return
+
+        at_bottom = self.text_widget.yview()[1] >= 0.999
+
+        self.text_widget.config(state="normal")
+        block = "\n".join(lines) + "\n"
+        if tag and color:
+            if self._configured_tags.get(tag) != color:
+                self.text_widget.tag_configure(tag, foreground=color)
+                self._configured_tags[tag] = color
+            self.text_widget.insert("end", block, tag)
+        else:
+            self.text_widget.insert("end", block)
+
+        end_line = int(self.text_widget.index('end-1c').split('.')[0])
+        if end_line > self._max_lines + 200:
+            self.text_widget.delete('1.0', f'{end_line - self._max_lines}.0')
+
+        if at_bottom and not self._see_pending:
+            self._see_pending = True
+            self.master.after_idle(self._do_see_end)
+        self.text_widget.config(state="disabled")
+
+    def _do_see_end(self):
+        """Runs on the Tk thread: one deferred scroll for a burst of log lines."""
+        self._see_pending = False
+        self.text_widget.see("end")
+
     def _finalize_morpheus_connection(self):
         """
         Clears console, sets morpheus_unlocked = True => GPT usage allowed.
@@ -262,35 +426,18 @@ class ConsoleWindow:
           - 'update charts'
           - 'installLIR' => self.launch_installLIR
           - 'LIR'        => self.launch_ladyinred
+        One dict probe over the precomputed command/synonym table.
         """
-        known_locals = {
-            "create wallets": self.request_wallet_creation,
-            "export addresses": self.export_addresses,
-            "update charts": self.handle_update_charts,
-            "installlir": self.launch_installLIR,
-            "lir": self.launch_ladyinred
-        }
-        synonyms = {
-            "create wallets": ["create wallet", "make wallets"],
-            "export addresses": ["export address", "export wallet addresses"],
-            "update charts": ["refresh charts", "update chart"],
-            "installlir": ["install lir", "install ladyinred", "install facefusion"],
-            "lir": ["ladyinred", "facefusion", "faceswap", "fusion time"]
-        }
-
-        lc_input = user_input.lower()
-        if lc_input in known_locals:
-            return known_locals[lc_input]
-
-        for cmd, syns in synonyms.items():
-            if lc_input in syns:
-                return known_locals[cmd]
-        return None
+        name = self._local_cmd_table.get(user_input.lower())
+        return getattr(self, name) if name else None
 
     def launch_installLIR(self):
         """
         Runs the installLIR.py script to install LadyInRed dependencies.
         """
+        import subprocess
+        import sys
+
         self.log("OPERATOR: Installing LadyInRed (FaceFusion). Please wait...", tag="operator", color="#00FF00")
         try:
             script_path = os.path.join("keymaker_dir", "installLIR.py")
@@ -305,6 +452,9 @@ class ConsoleWindow:
         to parse progress lines for (Downloading / Analysing / Extracting / Processing).
         We keep a single or two-line block in the console for each prefix's progress.
         """
+        import subprocess
+        import sys
+
         self.log("OPERATOR: Launching LadyInRed UI...", tag="operator", color="#00FF00")
 
         try:
@@ -314,11 +464,10 @@ class ConsoleWindow:
                 [sys.executable, script_path, "run", "--open-browser"],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True  # so we get string lines
+                bufsize=0  # raw bytes; the capture thread chunks + splits
             )
-            # Start a thread to read lines from the process
-            t = Thread(target=self._capture_lir_output, args=(self.lir_process,), daemon=True)
-            t.start()
+            # Hand the pipe to the shared selector loop
+            self._watch_child_stdout(self.lir_process, self._on_lir_line, self._on_lir_eof)
 
             self.log("OPERATOR: LadyInRed triggered. (Browser UI should open)", 
                      tag="operator", color="#00FF00")
@@ -326,28 +475,65 @@ class ConsoleWindow:
         except Exception as e:
             self.log(f"OPERATOR: Error launching LadyInRed: {e}", tag="operator", color="#FF0000")
 
-    def _capture_lir_output(self, process):
+    def _watch_child_stdout(self, process, on_line, on_eof):
         """
-        Reads lines from ladyinred process stdout in real time,
-        looks for progress patterns, logs them in console with single-line progress.
+        Register a child's stdout with the shared selector and make sure
+        the reader loop is running. `on_line` gets each decoded CR/LF
+        segment; `on_eof` fires once when the pipe closes.
         """
-        while True:
-            line = process.stdout.readline()
-            if not line and process.poll() is not None:
-                # The process ended
-                break
-            if line:
-                line = line.rstrip("\n\r")
-                parsed = self._parse_lir_line(line)
-                if parsed is not None:
-                    # If we have a recognized prefix & percentage => update progress
-                    self._update_lir_progress(parsed)
-                else:
-                    # Optionally show raw lines or skip
-                    # self.log(f"LADY IN RED (raw): {line}", tag="ladyinred", color="#FF55FF")
-                    pass
+        os.set_blocking(process.stdout.fileno(), False)
+        self._io_selector.register(
+            process.stdout,
+            selectors.EVENT_READ,
+            data=(bytearray(), on_line, on_eof)
+        )
+        if self._io_thread is None or not self._io_thread.is_alive():
+            self._io_thread = Thread(target=self._io_loop, daemon=True)
+            self._io_thread.start()
 
-        # process ended
+    def _io_loop(self):
+        """
+        Single reader thread for all child pipes. Reads raw 4 KB chunks
+        from whichever fd is ready and splits on CR/LF, so tqdm's \\r
+        redraws each become one parsed record instead of a readline()
+        call (and decode) per tick.
+        """
+        while True:
+            if not self._io_selector.get_map():
+                time.sleep(0.1)
+                continue
+            for key, _ in self._io_selector.select(timeout=0.1):
+                buf, on_line, on_eof = key.data
+                try:
+                    chunk = os.read(key.fileobj.fileno(), 4096)
+                except BlockingIOError:
+                    continue
+                if not chunk:
+                    # EOF => the process ended (or closed its stdout)
+                    self._io_selector.unregister(key.fileobj)
+                    on_eof()
+                    continue
+                buf += chunk
+
+                # Split on \r and \n; the last element is a partial segment
+                segments = re.split(rb'[\r\n]', bytes(buf))
+                buf[:] = segments.pop()
+
+                for seg in segments:
+                    if seg:
+                        on_line(seg.decode("utf-8", "replace"))
+
+    def _on_lir_line(self, line):
+        parsed = self._parse_lir_line(line)
+        if parsed is not None:
+            # Queue for the Tk thread instead of touching the Text
+            # widget from the reader thread
+            self._lir_queue.put(parsed)
+            if not self._lir_pending:
+                self._lir_pending = True
+                self.master.after_idle(self._drain_lir_queue)
+
+    def _on_lir_eof(self):
         self.log("LADY IN RED: process finished.", tag="ladyinred", color="#FF55FF")
 
     def _parse_lir_line(self, line):
@@ -361,40 +547,102 @@ class ConsoleWindow:
           {"prefix": <str>, "value": <int>, "speed": <str or None>}
         or None if not recognized.
         """
-        # Quick search for prefix
-        # e.g. "Downloading: 100%|", "Analysing:", "Extracting:", "Processing:"
-        prefix_match = re.search(r"^(Downloading|Analysing|Extracting|Processing):\s*", line)
-        if not prefix_match:
+        if not line.startswith(_LIR_PREFIXES):
             return None
-        prefix = prefix_match.group(1)  # e.g. "Processing"
 
-        # Now search for a percentage, e.g. " 12%" or "100%"
-        percent_match = re.search(r"(\d+)%", line)
-        if not percent_match:
-            # maybe 0 or no percent found => handle partial
-            # you can default to 0 or skip
+        # One precompiled alternation => prefix + percent + optional speed
+        # instead of four separate re.search calls per line
+        m = _LIR_LINE_RE.match(line)
+        if not m:
             return None
-        p_str = percent_match.group(1)
+
+        return {
+            "prefix": m.group("prefix"),  # "Downloading", "Analysing", etc.
+            "value": int(m.group("pct")), # 0..100
+            "speed": m.group("speed")     # "12.6B/s" or "1.06frame/s" or None
+        }
+
+    def _drain_lir_queue(self):
+        """
+        Runs on the Tk thread: coalesce queued progress dicts (keeping
+        only the newest per prefix) and draw each once.
+        """
+        latest = {}
         try:
-            val = int(p_str)
-        except:
-            return None
+            while True:
+                parsed = self._lir_queue.get_nowait()
+                latest[parsed["prefix"]] = parsed
+        except Empty:
+            pass
+
+        for parsed in latest.values():
+            self._update_lir_progress(parsed)
 
-        # Speed => either something like "([\d\.]+B/s)" or "([\d\.]+frame/s)"
-        speed_str = None
-        speed_b = re.search(r"([\d\.]+B/s)", line)
-        if speed_b:
-            speed_str = speed_b.group(1)
+        self._lir_pending = False
+        if not self._lir_queue.empty():
+            self._lir_pending = True
+            self.master.after(33, self._drain_lir_queue)
+
+    def _render_progress_bar(self, percent, spin):
+        """
+        Builds the shared 'Progress: [##/...] NN%' line with the spinner
+        at the active slot. `spin` is an itertools.cycle over the spinner
+        chars, so every progress path uses one implementation.
+        """
+        slot_index = percent // 10
+        if slot_index < 10:
+            bar = _BAR_FULL[:slot_index] + next(spin) + _BAR_EMPTY[:9 - slot_index]
         else:
-            speed_f = re.search(r"([\d\.]+frame/s)", line)
-            if speed_f:
-                speed_str = speed_f.group(1)
+            bar = _BAR_FULL
+        return f"Progress: [{bar}] {percent}%"
 
-        return {
-            "prefix": prefix,   # "Downloading", "Analysing", etc.
-            "value": val,       # 0..100
-            "speed": speed_str  # "12.6B/s" or "1.06frame/s" or None
-        }
+    def _queue_progress_line(self, bar_display):
+        """
+        Thread-safe progress-bar update: queue the rendered line; the Tk
+        thread overwrites the last console line with the newest value.
+        """
+        self._progress_queue.put(bar_display)
+        if not self._progress_pending:
+            self._progress_pending = True
+            self.master.after_idle(self._drain_progress_queue)
+
+    def _drain_progress_queue(self):
+        """Runs on the Tk thread: draw only the newest queued bar line."""
+        line = None
+        try:
+            while True:
+                line = self._progress_queue.get_nowait()
+        except Empty:
+            pass
+
+        if line is not None:
+            self.text_widget.config(state="normal")
+            if not self._progress_block_open:
+                # Anchor the block with a floating mark once; overwriting
+                # via the mark is O(1) vs re-resolving "end-2l" each tick
+                self.text_widget.mark_set("progress_start", "end-1c")
+                self.text_widget.mark_gravity("progress_start", "left")
+                self._progress_block_open = True
+                self.text_widget.insert("progress_start", line + "\n", "operator")
+            else:
+                # One atomic edit per tick (replace) instead of a
+                # delete + insert pair; the mark always exists here
+                self.text_widget.replace(
+                    "progress_start", "progress_start + 1 lines",
+                    line + "\n", "operator"
+                )
+            self.text_widget.config(state="disabled")
+
+        self._progress_pending = False
+        if not self._progress_queue.empty():
+            self._progress_pending = True
+            self.master.after(33, self._drain_progress_queue)
+
+    def _close_progress_block(self):
+        """Runs on the Tk thread: the next progress task starts a fresh block."""
+        self._progress_block_open = False
+        # mark_unset ignores names that were never set
+        self.text_widget.mark_unset("progress_start")
 
     def _update_lir_progress(self, parsed):
         """
@@ -414,49 +662,38 @@ class ConsoleWindow:
 
             self.lir_current_prefix = prefix
             self.lir_progress_map[prefix] = 0
-            self.lir_spinner_states[prefix] = 0
+            self.lir_spinner_cycles[prefix] = itertools.cycle(_SPINNER_CHARS)
             self.log(f"LADY IN RED: Starting {prefix} ...", tag="ladyinred", color="#FF55FF")
 
+            # Anchor this prefix's two-line block with a floating mark:
+            # marks track their spot for free, no "end-3l" arithmetic
+            self.text_widget.config(state="normal")
+            self.text_widget.mark_set(f"lir_{prefix}_start", "end-1c")
+            self.text_widget.mark_gravity(f"lir_{prefix}_start", "left")
+            self.text_widget.insert("end", "\n\n", "ladyinred")
+            self.text_widget.config(state="disabled")
+
         # clamp val to 0..100
         p = max(0, min(val, 100))
         self.lir_progress_map[prefix] = p
 
-        # Update spinner index for this prefix
-        idx = self.lir_spinner_states[prefix]
-        spinner_char = self.lir_spinners[idx]
-        idx = (idx + 1) % len(self.lir_spinners)
-        self.lir_spinner_states[prefix] = idx
-
-        # Build first line: e.g. "LADY IN RED: Processing => 25% (speed=...)" 
+        # Build first line: e.g. "LADY IN RED: Processing => 25% (speed=...)"
         text_line = f"LADY IN RED: {prefix} => {p}%"
         if speed:
             text_line += f" (speed={speed})"
 
-        # Build the progress bar line
-        bar_len = 10
-        progress_bar = [' '] * bar_len
-        slot_index = int(p / 10)  # each 10% is 1 chunk
-        for i in range(bar_len):
-            if i < slot_index:
-                progress_bar[i] = '#'
-            elif i == slot_index:
-                progress_bar[i] = spinner_char
-            else:
-                progress_bar[i] = ' '
-
-        bar_display = f"Progress: [{''.join(progress_bar)}] {p}%"
+        # Shared renderer draws from this prefix's spinner cycle
+        bar_display = self._render_progress_bar(p, self.lir_spinner_cycles[prefix])
 
-        # Overwrite the previous TWO lines in the console
+        # Overwrite this prefix's TWO lines via its anchor mark
+        mark = f"lir_{prefix}_start"
         self.text_widget.config(state="normal")
-        try:
-            # remove last two lines
-            self.text_widget.delete("end-3l", "end-1l")
-        except:
-            pass
-
-        # Insert new lines
-        self.text_widget.insert("end", text_line + "\n", "ladyinred")
-        self.text_widget.insert("end", bar_display + "\n", "ladyinred")
+        # The mark (and its placeholder lines) exist from the moment the
+        # prefix started => one atomic replace per tick, no guard needed
+        self.text_widget.replace(
+            mark, f"{mark} + 2 lines",
+            text_line + "\n" + bar_display + "\n", "ladyinred"
+        )
         self.text_widget.config(state="disabled")
 
     def launch_facefusion(self):
@@ -471,22 +708,15 @@ class ConsoleWindow:
         """
         Minimal check if user_input is a recognized CLI command in Flow 1.
         """
-        known_cli_starts = [
-            "open wallet",
-            "close wallet",
-            "list asset",
-            "list address",
-            "show state",
-            "exit",
-            "help",
-            "send",
-            "create wallet"
-        ]
-        lc_input = user_input.lower()
-        for c in known_cli_starts:
-            if lc_input.startswith(c):
-                return True
-        return False
+        return user_input.lower().startswith(_CLI_PREFIXES)
+
+    def _log_cli_block(self, resp):
+        """
+        Prefix every response line and push the whole block through log()
+        in ONE widget insert instead of one per line.
+        """
+        block = "\n".join(f"CLI Output: {line}" for line in resp.splitlines())
+        self.log(block, tag="operator", color="#00FF00")
 
     # ---------------------------------------------------------------------
     # CLI Password Flow
@@ -500,11 +730,8 @@ class ConsoleWindow:
         try:
             resp = self.cli_manager.execute_cli_command(password)
             if resp:
-                wrong_pass = False
-                for line in resp.splitlines():
-                    self.log(f"CLI Output: {line}", tag="operator", color="#00FF00")
-                    if "wrong password" in line.lower() or "invalid password" in line.lower():
-                        wrong_pass = True
+                self._log_cli_block(resp)
+                wrong_pass = bool(_WRONG_PW_RE.search(resp))
 
                 if wrong_pass:
                     self.force_cli_stop("Wrong password. CLI is stopped. Re-click 'Connect Morpheus Wallet'.")
@@ -523,7 +750,12 @@ class ConsoleWindow:
         "list asset" => parse 'GAS:' => if found => finalize Morpheus => 'TRIGGER: finalize_morpheus_success'
         """
         try:
-            resp = self.cli_manager.execute_cli_command("list asset")
+            cached_resp, ts = self._list_asset_cache
+            if cached_resp is not None and (time.time() - ts) < 2.0:
+                resp = cached_resp
+            else:
+                resp = self.cli_manager.execute_cli_command("list asset")
+                self._list_asset_cache = (resp, time.time())
             if not resp:
                 self.log("OPERATOR: 'list asset' gave no response or timed out. Stopping CLI.",
                          tag="operator", color="#FF0000")
@@ -531,22 +763,17 @@ class ConsoleWindow:
                 return
 
             self.log("[Console] 'list asset' full response:", tag="operator", color="#00FF00")
-            for line in resp.splitlines():
-                self.log(f"CLI Output: {line}", tag="operator", color="#00FF00")
+            self._log_cli_block(resp)
 
-            # Attempt parse GAS
+            # Attempt parse GAS => single compiled-regex sweep
             gas_balance = "N/A"
-            for line in resp.splitlines():
-                if "gas:" in line.lower():
-                    parts = line.lower().split("gas:")
-                    if len(parts) > 1:
-                        potential = parts[1].strip().split()[0]
-                        try:
-                            float(potential)
-                            gas_balance = potential
-                        except:
-                            pass
-                    break
+            m = _GAS_RE.search(resp)
+            if m:
+                try:
+                    float(m.group(1))
+                    gas_balance = m.group(1)
+                except ValueError:
+                    pass
 
             if gas_balance != "N/A":
                 if self.on_gas_update:
@@ -574,6 +801,7 @@ class ConsoleWindow:
         self.cli_manager.stop()
         self.cli_password_in_progress = False
         self.morpheus_unlocked = False
+        self._list_asset_cache = (None, 0.0)
 
     # ---------------------------------------------------------------------
     # Multi-Wallet Creation (Local Vault)
@@ -615,42 +843,26 @@ class ConsoleWindow:
                          tag="operator", color="#00FF00")
 
     def create_wallets(self, count, passphrase):
-        Thread(target=self._create_wallets_thread, args=(count, passphrase), daemon=True).start()
+        self._pool.submit(self._create_wallets_thread, count, passphrase)
 
     def _create_wallets_thread(self, count, passphrase):
         try:
-            progress_bar = [' '] * 10
-            spinner = ['/', '-', '\\', '|']
-            spinner_index = 0
-
-            def update_progress(percent):
-                nonlocal spinner_index
-                slot_index = percent // 10
-                for i in range(len(progress_bar)):
-                    if i < slot_index:
-                        progress_bar[i] = '#'
-                    elif i == slot_index:
-                        progress_bar[i] = spinner[spinner_index % len(spinner)]
-                        spinner_index = (spinner_index + 1) % len(spinner)
-                    else:
-                        progress_bar[i] = ' '
-
-                bar_display = f"Progress: [{''.join(progress_bar)}] {percent}%"
-                self.text_widget.config(state="normal")
-                try:
-                    self.text_widget.delete("end-2l", "end-1l")
-                except:
-                    pass
-                self.text_widget.insert("end", bar_display + "\n", "operator")
-                self.text_widget.config(state="disabled")
-
-            total_created = 0
-            for i in range(count):
-                new_file = self.local_wallet.create_wallet(passphrase)
-                total_created += 1
-
-                pct = int((i + 1) / count * 100)
-                update_progress(pct)
+            spin = itertools.cycle(_SPINNER_CHARS)
+            last_pct = -1
+
+            # Only redraw on whole-percent boundaries => at most 100
+            # widget updates regardless of wallet count
+            def update_progress(pct):
+                nonlocal last_pct
+                if pct == last_pct:
+                    return
+                last_pct = pct
+                self._queue_progress_line(self._render_progress_bar(pct, spin))
+
+            # Key derivation fans out across CPU cores; the vault is
+            # written once at the end (see Wallet.create_wallets_batch)
+            created = self.local_wallet.create_wallets_batch(count, passphrase, update_progress)
+            total_created = len(created)
 
             self.log(f"OPERATOR: Wallet creation completed. Created {total_created} wallets.",
                      tag="operator", color="#00FF00")
@@ -661,6 +873,7 @@ class ConsoleWindow:
         except Exception as e:
             self.log(f"OPERATOR: Error creating wallets: {e}", tag="operator", color="#FF0000")
         finally:
+            self.master.after_idle(self._close_progress_block)
             self.reset_wallet_creation_state()
 
     def reset_wallet_creation_state(self):
@@ -673,6 +886,8 @@ class ConsoleWindow:
     # Export addresses with progress
     # ---------------------------------------------------------------------
     def export_addresses(self):
+        from tkinter import filedialog
+
         filename = filedialog.asksaveasfilename(
             title="Save Wallet Addresses",
             defaultextension=".txt",
@@ -687,41 +902,22 @@ class ConsoleWindow:
             )
 
     def track_progress(self, task, init_message, completion_message):
-        Thread(
-            target=self._track_progress_thread,
-            args=(task, init_message, completion_message),
-            daemon=True
-        ).start()
+        self._pool.submit(self._track_progress_thread, task, init_message, completion_message)
 
     def _track_progress_thread(self, task, init_message, completion_message):
         try:
             if init_message:
                 self.log(init_message, tag="operator", color="#00FF00")
 
-            progress_bar = [' '] * 10
-            spinner = ['/', '-', '\\', '|']
-            spinner_index = 0
+            spin = itertools.cycle(_SPINNER_CHARS)
+            last_pct = -1
 
             def update_progress(percent):
-                nonlocal spinner_index
-                slot_index = percent // 10
-                for i in range(len(progress_bar)):
-                    if i < slot_index:
-                        progress_bar[i] = '#'
-                    elif i == slot_index:
-                        progress_bar[i] = spinner[spinner_index % len(spinner)]
-                        spinner_index = (spinner_index + 1) % len(spinner)
-                    else:
-                        progress_bar[i] = ' '
-
-                bar_display = f"Progress: [{''.join(progress_bar)}] {percent}%"
-                self.text_widget.config(state="normal")
-                try:
-                    self.text_widget.delete("end-2l", "end-1l")
-                except:
-                    pass
-                self.text_widget.insert("end", bar_display + "\n", "operator")
-                self.text_widget.config(state="disabled")
+                nonlocal last_pct
+                if percent == last_pct:
+                    return
+                last_pct = percent
+                self._queue_progress_line(self._render_progress_bar(percent, spin))
 
             task(update_progress)
             if completion_message:
@@ -729,6 +925,8 @@ class ConsoleWindow:
 
         except Exception as e:
             self.log(f"OPERATOR: Error: {e}", tag="operator", color="#FF0000")
+        finally:
+            self.master.after_idle(self._close_progress_block)
 
     # ---------------------------------------------------------------------
     # A stub method for "update charts"
@@ -772,15 +970,18 @@ class ConsoleWindow:
         try:
             resp = self.cli_manager.execute_cli_command(command)
             if resp:
-                for line in resp.splitlines():
-                    self.log(f"CLI Output: {line}", tag="operator", color="#00FF00")
-
-                    # detect wrong password or leftover
-                    if "wrong password" in line.lower() or "invalid password" in line.lower():
-                        self.force_cli_stop("Wrong password from SERAPH command. Re-click 'Connect Morpheus Wallet'.")
-                        return
-                    if ("neo> password:" in line.lower() or "you have to open the wallet first" in line.lower()):
-                        if not self.cli_password_in_progress:
-                            self.force_cli_stop("Leftover open wallet from SERAPH command. Re-click 'Connect Morpheus Wallet'.")
+                self.log_many(
+                    [f"CLI Output: {line}" for line in resp.splitlines()],
+                    tag="operator", color="#00FF00"
+                )
+
+                # detect wrong password or leftover: one pass over the
+                # whole response instead of lowercasing per line
+                if _WRONG_PW_RE.search(resp):
+                    self.force_cli_stop("Wrong password from SERAPH command. Re-click 'Connect Morpheus Wallet'.")
+                    return
+                if _LEFTOVER_RE.search(resp):
+                    if not self.cli_password_in_progress:
+                        self.force_cli_stop("Leftover open wallet from SERAPH command. Re-click 'Connect Morpheus Wallet'.")
         except Exception as e:
             self.log(f"OPERATOR: CLI Error: {e}", tag="operator", color="#FF0000")
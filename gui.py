@@ -1,10 +1,11 @@
 import os
+import functools
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from PIL import Image, ImageTk
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import pyzipper
+
+# Heavy deps (PIL, matplotlib, pyzipper) are imported inside the
+# methods that use them - matplotlib alone costs hundreds of ms of
+# cold start, and the key-save path may never run at all
 
 # Local modules
 from keymaker_dir.console import ConsoleWindow
@@ -13,6 +14,14 @@ from keymaker_dir.exporter import WalletExporter
 from keymaker_dir.neo_cli import NeoCliManager
 from keymaker_dir.wallet_manager import WalletManager
 
+@functools.lru_cache(maxsize=4)
+def _load_crt(path, width, height):
+    """Decode + resize the CRT frame once; reopening windows reuses it."""
+    from PIL import Image, ImageTk
+    crt_image = Image.open(path).resize((width, height))
+    return ImageTk.PhotoImage(crt_image)
+
+
 class KeyMakerApp:
     """
     Main GUI for KeyMaker, integrating:
@@ -156,6 +165,17 @@ class KeyMakerApp:
         self.center_frame = tk.Frame(self.master, bg="#15191F")
         self.center_frame.grid(row=0, column=1, sticky="nsew", padx=(5, 5), pady=(15, 15))
         self.diagram_frames = self.center_frame
+
+        # Figure + canvas are built ONCE; refreshes just clear the axes
+        # and redraw instead of churning widgets and Artist objects
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.volume_chart_figure = Figure(figsize=(6.3, 7.2), dpi=100, facecolor="#15191F")
+        self.volume_chart_ax = self.volume_chart_figure.add_subplot(111)
+        self.volume_figure = FigureCanvasTkAgg(self.volume_chart_figure, self.diagram_frames)
+        self.volume_figure.get_tk_widget().pack(expand=True, fill="both", padx=10, pady=(20, 10))
+
         self.update_diagrams()
 
     # -------------------------------------------------------------------------
@@ -168,8 +188,7 @@ class KeyMakerApp:
 
         # Attempt to load CRT image
         try:
-            crt_image = Image.open("F:/KeyMaker/crt.png").resize((600, 450))
-            crt_photo = ImageTk.PhotoImage(crt_image)
+            crt_photo = _load_crt("F:/KeyMaker/crt.png", 600, 450)
             crt_label = tk.Label(self.right_frame, image=crt_photo, bg="black")
             crt_label.pack(pady=5)
             self.right_frame.crt_photo = crt_photo  # keep reference to avoid GC
@@ -211,7 +230,9 @@ class KeyMakerApp:
             font=("Courier", 14, "bold")
         ).pack(pady=(20, 10))
 
-        self.api_keys_entries = {}
+        # Ordered (label, Entry) pairs for saving; the dict view is for
+        # O(1) label lookup when reloading values from the zip
+        self.api_keys_entries = []
         labels = [
             "ChatGPT API Key",
             "Twitter Consumer Key",
@@ -236,7 +257,8 @@ class KeyMakerApp:
                 width=40
             )
             ent.pack(anchor="w", padx=10, pady=2)
-            self.api_keys_entries[lbl_text] = ent
+            self.api_keys_entries.append((lbl_text, ent))
+        self.api_keys_by_label = dict(self.api_keys_entries)
 
         btn_frame = tk.Frame(self.api_key_frame, bg="#15191F")
         btn_frame.pack(pady=15)
@@ -287,6 +309,7 @@ class KeyMakerApp:
         self.api_key_frame.grid(row=0, column=0, sticky="nsew", padx=(15, 10), pady=(15, 15))
 
         if self.morpheus_connected and self.morpheus_wallet_zip_path and self.morpheus_wallet_password:
+            import pyzipper
             try:
                 with pyzipper.AESZipFile(self.morpheus_wallet_zip_path, 'r', encryption=pyzipper.WZ_AES) as zf:
                     zf.setpassword(self.morpheus_wallet_password)
@@ -297,9 +320,10 @@ class KeyMakerApp:
                                 key_name, val = line.split(":", 1)
                                 k = key_name.strip()
                                 v = val.strip()
-                                if k in self.api_keys_entries:
-                                    self.api_keys_entries[k].delete(0, tk.END)
-                                    self.api_keys_entries[k].insert(0, v)
+                                ent = self.api_keys_by_label.get(k)
+                                if ent is not None:
+                                    ent.delete(0, tk.END)
+                                    ent.insert(0, v)
             except Exception as e:
                 print(f"[GUI] Could not load existing api_keys.txt: {e}")
 
@@ -317,33 +341,48 @@ class KeyMakerApp:
             messagebox.showerror("Error", "Morpheus wallet not connected or missing zip path/password.")
             return
 
-        lines = []
-        for lbl_text, entry in self.api_keys_entries.items():
-            val = entry.get().strip()
-            lines.append(f"{lbl_text}: {val}")
-
-        combined = "\n".join(lines)
+        combined = "\n".join(
+            f"{lbl_text}: {entry.get().strip()}"
+            for lbl_text, entry in self.api_keys_entries
+        )
 
+        import pyzipper
         try:
-            # read old files except api_keys.txt
-            old_files = {}
             with pyzipper.AESZipFile(self.morpheus_wallet_zip_path, 'r', encryption=pyzipper.WZ_AES) as zf:
                 zf.setpassword(self.morpheus_wallet_password)
-                for name in zf.namelist():
-                    if name != "api_keys.txt":
-                        old_files[name] = zf.read(name)
-
-            # rewrite zip in 'w' mode
-            with pyzipper.AESZipFile(
-                self.morpheus_wallet_zip_path,
-                'w',
-                compression=pyzipper.ZIP_DEFLATED,
-                encryption=pyzipper.WZ_AES
-            ) as zf:
-                zf.setpassword(self.morpheus_wallet_password)
-                for name, data in old_files.items():
-                    zf.writestr(name, data)
-                zf.writestr("api_keys.txt", combined)
+                has_old_keys = "api_keys.txt" in zf.namelist()
+
+            if not has_old_keys:
+                # Fast path: nothing to replace => one appended member,
+                # the wallet entries are never decrypted/re-encrypted
+                with pyzipper.AESZipFile(
+                    self.morpheus_wallet_zip_path,
+                    'a',
+                    compression=pyzipper.ZIP_DEFLATED,
+                    encryption=pyzipper.WZ_AES
+                ) as zf:
+                    zf.setpassword(self.morpheus_wallet_password)
+                    zf.writestr("api_keys.txt", combined)
+            else:
+                # Zip members can't be replaced in place: rewrite into a
+                # sibling temp file, streaming entries instead of pulling
+                # every decrypted member into one dict, then swap it in
+                tmp_path = self.morpheus_wallet_zip_path + ".tmp"
+                with pyzipper.AESZipFile(self.morpheus_wallet_zip_path, 'r', encryption=pyzipper.WZ_AES) as src, \
+                     pyzipper.AESZipFile(
+                         tmp_path,
+                         'w',
+                         compression=pyzipper.ZIP_DEFLATED,
+                         encryption=pyzipper.WZ_AES
+                     ) as dst:
+                    src.setpassword(self.morpheus_wallet_password)
+                    dst.setpassword(self.morpheus_wallet_password)
+                    for name in src.namelist():
+                        if name != "api_keys.txt":
+                            with src.open(name) as fp:
+                                dst.writestr(name, fp.read())
+                    dst.writestr("api_keys.txt", combined)
+                os.replace(tmp_path, self.morpheus_wallet_zip_path)
 
             messagebox.showinfo("Success", "API keys saved successfully.")
         except Exception as e:
@@ -501,17 +540,18 @@ class KeyMakerApp:
 
     def update_diagrams(self):
         """Refresh bar charts in the center using stats_manager data."""
-        for widget in self.diagram_frames.winfo_children():
-            widget.destroy()
-
-        figure = Figure(figsize=(6.3, 7.2), dpi=100, facecolor="#15191F")
-        ax = figure.add_subplot(111)
+        ax = self.volume_chart_ax
+        ax.clear()
 
         dates, full_counts, empty_counts = self.stats_manager.get_wallet_volume_trend()
 
-        bars_full = ax.bar(dates, full_counts, color="#5A9", edgecolor="#00FFAA", width=0.6, label="Full")
+        # Numeric x positions skip matplotlib's categorical-unit
+        # machinery (a per-call string registry); the date strings only
+        # appear as tick labels below
+        xs = range(len(dates))
+        bars_full = ax.bar(xs, full_counts, color="#5A9", edgecolor="#00FFAA", width=0.6, label="Full")
         bars_empty = ax.bar(
-            dates,
+            xs,
             empty_counts,
             color="#333",
             edgecolor="#00FFAA",
@@ -520,25 +560,12 @@ class KeyMakerApp:
             bottom=full_counts
         )
 
-        for bar, count in zip(bars_full, full_counts):
-            ax.text(
-                bar.get_x() + bar.get_width() / 2,
-                bar.get_height() + 0.5,
-                f"{count}",
-                ha="center",
-                color="#20E8AA",
-                fontsize=10
-            )
-        for bar, count in zip(bars_empty, empty_counts):
-            stacked_bottom = bar.get_y() + bar.get_height()
-            ax.text(
-                bar.get_x() + bar.get_width() / 2,
-                stacked_bottom + 0.5,
-                f"{count}",
-                ha="center",
-                color="#FF4444",
-                fontsize=10
-            )
+        # bar_label places every label in one vectorized call instead of
+        # per-bar get_x/get_width/get_height Python getters
+        ax.bar_label(bars_full, labels=[f"{c}" for c in full_counts],
+                     padding=3, color="#20E8AA", fontsize=10)
+        ax.bar_label(bars_empty, labels=[f"{c}" for c in empty_counts],
+                     padding=3, color="#FF4444", fontsize=10)
 
         ax.set_title("Wallet Volume Trend", color="#20E8AA")
         ax.set_facecolor("#15191F")
@@ -547,12 +574,10 @@ class KeyMakerApp:
         ax.spines["left"].set_color("#20E8AA")
         ax.set_xlabel("Creation Date", color="#20E8AA")
         ax.set_ylabel("Volume", color="#20E8AA")
-        ax.set_xticks(range(len(dates)))
-        ax.set_xticklabels(dates, rotation=45, fontsize=8, ha="right")
+        ax.set_xticks(xs, labels=dates, rotation=45, fontsize=8, ha="right")
         ax.legend()
 
-        self.volume_figure = FigureCanvasTkAgg(figure, self.diagram_frames)
-        self.volume_figure.get_tk_widget().pack(expand=True, fill="both", padx=10, pady=(20, 10))
+        self.volume_figure.draw_idle()
 
     def on_closing(self):
         """Cleanup tasks before closing the window."""
@@ -16,13 +16,18 @@ import os
 import sys
 import subprocess
 import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Resolved once; a PATH lookup answers "is ffmpeg installed" without
+# spawning the whole codec-loading ffmpeg process
+_FFMPEG_PATH = shutil.which("ffmpeg")
 
 def check_ffmpeg():
-    """Check if 'ffmpeg' is on PATH by trying ffmpeg -version."""
-    try:
-        out = subprocess.check_output(["ffmpeg", "-version"], stderr=subprocess.STDOUT)
+    """Check if 'ffmpeg' is on PATH via shutil.which (no subprocess)."""
+    if _FFMPEG_PATH:
         print("[installLIR] Detected ffmpeg on system PATH. Good.")
-    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+    else:
         print("[installLIR] WARNING: ffmpeg not found on PATH.")
         print("   FaceFusion might fail on certain video operations.")
         print("   Please install or add ffmpeg to PATH for best results.")
@@ -40,9 +45,55 @@ def install_facefusion_python_libs():
         "insightface",
         "filetype",
         "scipy",
+        "hf_transfer",  # Rust multi-connection downloader for HuggingFace models
         # Add others as needed, e.g. "numpy==2.2.0"
     ]
 
+    # Wheel fetches are network-bound, so download every package
+    # concurrently first; the install step below then just links the
+    # cached wheels with --no-index (no serial downloading inside pip).
+    dl_dir = None
+    try:
+        dl_dir = tempfile.mkdtemp(prefix="lir_wheels_")
+        print(f"[installLIR] Downloading wheels in parallel to {dl_dir} ...")
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = {
+                pool.submit(
+                    subprocess.run,
+                    [sys.executable, "-m", "pip", "download", "--dest", dl_dir, pkg],
+                    check=True
+                ): pkg
+                for pkg in libs
+            }
+            for fut in as_completed(futures):
+                fut.result()  # raises if that package's download failed
+
+        install_cmd = [
+            sys.executable, "-m", "pip", "install", "--upgrade",
+            "--no-index", "--find-links", dl_dir
+        ] + libs
+        subprocess.run(install_cmd, check=True)
+        print("[installLIR] Extra Python libs installed successfully.")
+        return True
+    except Exception as e:
+        print(f"[installLIR] Parallel download path failed ({e}), using plain pip install...")
+    finally:
+        if dl_dir:
+            shutil.rmtree(dl_dir, ignore_errors=True)
+
+    # In-process pip skips a whole interpreter spawn + pip re-import.
+    # pip's internal API isn't stable, so fall back to the subprocess
+    # form if it's missing or errors out.
+    try:
+        from pip._internal.cli.main import main as pip_main
+        exit_code = pip_main(["install", "--upgrade"] + libs)
+        if exit_code == 0:
+            print("[installLIR] Extra Python libs installed successfully.")
+            return True
+        print(f"[installLIR] In-process pip exited with code {exit_code}, retrying via subprocess...")
+    except Exception as e:
+        print(f"[installLIR] In-process pip unavailable ({e}), falling back to subprocess...")
+
     pip_cmd = [
         sys.executable, "-m", "pip", "install", "--upgrade"
     ] + libs
@@ -81,21 +132,15 @@ def run_facefusion_install(onnx_provider="cuda"):
         "--skip-conda",
     ]
 
-    try:
-        subprocess.run(cmd, check=True, cwd=facefusion_dir)
-        print("[installLIR] FaceFusion install.py completed successfully.")
-    except subprocess.CalledProcessError as e:
-        print(f"[installLIR] ERROR: facefusion install.py step failed: {e}")
-        return False
+    # The model fetch (network-bound, multi-GB) is overlapped with
+    # install.py (CPU-bound wheel unpacking): both run as Popen children
+    # and we wait on them together, so wall time is max() not sum().
+    # With hf_transfer installed (see install_facefusion_python_libs),
+    # this flag makes huggingface_hub pull each shard over multiple
+    # connections instead of one sequential stream.
+    download_env = {**os.environ, "HF_HUB_ENABLE_HF_TRANSFER": "1"}
 
-    # Attempt optional 'facefusion.py download --download-scope full'
     facefusion_py = os.path.join(facefusion_dir, "facefusion.py")
-    if not os.path.exists(facefusion_py):
-        print("[installLIR] WARNING: facefusion.py not found, skipping download step.")
-        return True  # Not critical
-
-    print("[installLIR] Downloading all FaceFusion models with scope=full (via huggingface & github fallback).")
-    # Some FaceFusion versions do not have a 'download' subcommand. We'll ignore the error if so.
     download_cmd = [
         sys.executable,
         facefusion_py,
@@ -103,12 +148,36 @@ def run_facefusion_install(onnx_provider="cuda"):
         "--download-scope", "full"
     ]
 
-    try:
-        subprocess.run(download_cmd, check=True, cwd=facefusion_dir)
-        print("[installLIR] FaceFusion models downloaded with scope=full.")
-    except subprocess.CalledProcessError as e:
-        print("[installLIR] WARNING: facefusion download step failed:", e)
-        print("           You can still let FaceFusion auto-download models on demand.")
+    install_proc = subprocess.Popen(cmd, cwd=facefusion_dir)
+
+    download_proc = None
+    if os.path.exists(facefusion_py):
+        print("[installLIR] Downloading all FaceFusion models with scope=full (overlapped with install).")
+        download_proc = subprocess.Popen(download_cmd, cwd=facefusion_dir, env=download_env)
+    else:
+        print("[installLIR] WARNING: facefusion.py not found, skipping download step.")
+
+    if install_proc.wait() != 0:
+        print("[installLIR] ERROR: facefusion install.py step failed.")
+        if download_proc is not None:
+            download_proc.terminate()
+            download_proc.wait()
+        return False
+    print("[installLIR] FaceFusion install.py completed successfully.")
+
+    if download_proc is not None:
+        if download_proc.wait() != 0:
+            # The overlapped attempt may have started before the env was
+            # complete - retry once now that install.py finished.
+            print("[installLIR] Overlapped download failed, retrying once after install...")
+            try:
+                subprocess.run(download_cmd, check=True, cwd=facefusion_dir, env=download_env)
+                print("[installLIR] FaceFusion models downloaded with scope=full.")
+            except subprocess.CalledProcessError as e:
+                print("[installLIR] WARNING: facefusion download step failed:", e)
+                print("           You can still let FaceFusion auto-download models on demand.")
+        else:
+            print("[installLIR] FaceFusion models downloaded with scope=full.")
 
     return True
 
@@ -1,243 +1,441 @@
-import os
-import tkinter as tk
-from tkinter import messagebox, filedialog, simpledialog
-from tkinter.ttk import Progressbar
-from neo3.wallet.wallet import Wallet, DiskWallet
-
-
-# ------------------------------
-# Wallet Functions Module
-# ------------------------------
-
-def create_wallet(wallet_number: int, directory: str = "wallets"):
-    """Creates a new wallet and saves it in the specified directory with the appropriate name."""
-    if not os.path.exists(directory):
-        os.makedirs(directory)
-
-    wallet = Wallet()
-    # Provide empty string as password to avoid prompting for one
-    new_account = wallet.account_new(password="", label=f"Matrix_User_{wallet_number}")  # No password required
-    
-    wallet_path = os.path.join(directory, f"Matrix_User_{wallet_number}.json")
-    
-    while os.path.exists(wallet_path):
-        wallet_number += 1
-        wallet_path = os.path.join(directory, f"Matrix_User_{wallet_number}.json")
-    
-    wallet.save()  # Save the wallet
-    
-    return wallet
-
-def create_wallet_and_save(wallet_number: int, directory: str = "wallets"):
-    """Creates a new wallet and saves it to a JSON file in the specified directory."""
-    if not os.path.exists(directory):
-        os.makedirs(directory)
-
-    wallet_path = os.path.join(directory, f"Matrix_User_{wallet_number}.json")
-    
-    while os.path.exists(wallet_path):
-        wallet_number += 1
-        wallet_path = os.path.join(directory, f"Matrix_User_{wallet_number}.json")
-
-    wallet = DiskWallet.default(path=wallet_path)
-    # Provide empty string as password to avoid prompting for one
-    new_account = wallet.account_new(password="", label=f"Matrix_User_{wallet_number}")  # No password required
-    wallet.save()
-
-    return wallet
-
-def create_multiple_wallets(count: int, directory: str = "wallets", progress_bar=None, progress_label=None):
-    """Creates multiple wallets in the specified directory and updates the progress bar with percentage."""
-    for i in range(count):
-        create_wallet_and_save(i, directory)
-        if progress_bar:
-            fraction = (i + 1) / count * 100
-            progress_bar['value'] = fraction
-            progress_label.config(text=f"{int(fraction)}%")  # Update percentage label
-            progress_bar.update()
-
-    # Action completion message with a summary (Only one popup)
-    messagebox.showinfo("Wake up NEO", f"Successfully created {count} wallets!")
-
-
-def list_wallets(directory: str = "wallets") -> list:
-    """Lists all wallets in the specified directory."""
-    return os.listdir(directory)
-
-def get_wallet_count(directory: str = "wallets") -> int:
-    """Returns the number of wallets in the specified directory."""
-    return len(list_wallets(directory))
-
-def export_public_addresses(directory: str = "wallets", output_file: str = "public_addresses.txt"):
-    """Exports public addresses from all wallets into a .txt file."""
-    wallet_files = list_wallets(directory)
-    with open(output_file, "w") as file:
-        for wallet_file in wallet_files:
-            if wallet_file.endswith(".json"):
-                wallet_path = os.path.join(directory, wallet_file)
-                wallet = DiskWallet.from_file(wallet_path)
-                public_address = wallet.account_default.address
-                file.write(f"{public_address}\n")
-    return output_file
-
-
-# ------------------------------
-# Morpheus Wallet Module
-# ------------------------------
-
-class MorpheusWallet:
-    def __init__(self, wallet_file: str = "Morpheus_wallet.json"):
-        self.wallet_file = wallet_file
-        self.wallet = None
-        self.account = None
-        self.gas_balance = 100  # Placeholder for gas balance
-
-    def create_new_wallet(self, directory: str = "wallets"):
-        """Create a new Morpheus wallet and save it to the specified directory."""
-        self.wallet = Wallet()
-        self.account = self.wallet.account_new(password="", label="Morpheus_Master")  # No password required
-        self.save_wallet(directory)
-
-    def load_wallet(self, directory: str = "wallets"):
-        """Load an existing Morpheus wallet by selecting the directory."""
-        if os.path.exists(self.wallet_file):
-            self.wallet = DiskWallet.from_file(self.wallet_file)  # Use DiskWallet to load
-            self.account = self.wallet.accounts[0]  # Load the first account as the master
-            print(f"Loaded Morpheus wallet with address: {self.account.address}")
-        else:
-            raise FileNotFoundError("Morpheus wallet file does not exist.")
-
-    def save_wallet(self, directory: str = "wallets"):
-        """Save the Morpheus wallet to a file."""
-        wallet_path = os.path.join(directory, self.wallet_file)
-        disk_wallet = DiskWallet.default(path=wallet_path)  # Create a DiskWallet
-        disk_wallet.save()  # Save it using DiskWallet's save method
-        print(f"Morpheus wallet saved at {wallet_path}")
-
-    def get_gas_balance(self):
-        """Get the gas balance of the Morpheus wallet."""
-        return self.gas_balance
-
-
-# ------------------------------
-# GUI Module
-# ------------------------------
-
-class KeyMakerApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("KeyMaker Application")
-        self.root.geometry("600x400")  # Wider window to display full address
-        
-        # Set background color of the window
-        self.root.configure(bg="#20242B")
-        
-        # Default directories
-        self.wallets_directory = "wallets"
-        self.output_directory = os.getcwd()  # Current working directory
-        
-        # Morpheus wallet
-        self.morpheus_wallet = MorpheusWallet()
-        
-        # Labels with custom colors
-        self.wallet_address_label = tk.Label(root, text="Wallet Not Connected", font=("Arial", 14), fg="#20E8AA", bg="white", anchor="w")
-        self.wallet_address_label.pack(pady=10, padx=20, fill="x")
-
-        self.wallet_count = get_wallet_count(self.wallets_directory)
-        
-        # Label to show number of wallets
-        self.wallet_count_label = tk.Label(root, text=f"Current number of wallets: {self.wallet_count}", fg="#20E8AA", bg="#15191F")
-        self.wallet_count_label.pack(pady=10)
-
-        # Label to display gas balance of Morpheus
-        self.gas_balance_label = tk.Label(root, text="Gas Balance: Not Connected", font=("Arial", 12), fg="#20E8AA", bg="#15191F")
-        self.gas_balance_label.pack(pady=10)
-
-        # Button to create wallets
-        self.create_wallet_button = tk.Button(root, text="Create Wallets", command=self.create_wallets, bg="#20242B", fg="#20E8AA", relief="flat", borderwidth=0)
-        self.create_wallet_button.pack(pady=10)
-
-        # Button to export public addresses
-        self.export_button = tk.Button(root, text="Export Public Addresses", command=self.export_addresses, bg="#20242B", fg="#20E8AA", relief="flat", borderwidth=0)
-        self.export_button.pack(pady=10)
-
-        # Button to connect Morpheus wallet
-        self.connect_morpheus_button = tk.Button(root, text="Connect Morpheus Wallet", command=self.connect_morpheus_wallet, bg="#20242B", fg="#20E8AA", relief="flat", borderwidth=0)
-        self.connect_morpheus_button.pack(pady=10)
-
-        # Button to create Morpheus wallet
-        self.create_morpheus_button = tk.Button(root, text="Create Morpheus Wallet", command=self.create_morpheus_wallet, bg="#20242B", fg="#20E8AA", relief="flat", borderwidth=0)
-        self.create_morpheus_button.pack(pady=10)
-
-        # Progress bar
-        self.progress_bar = Progressbar(root, length=200, mode='determinate')
-        self.progress_bar.pack(pady=10)
-
-        # Label to show percentage in progress bar
-        self.progress_percentage_label = tk.Label(root, text="0%", font=("Arial", 10), fg="#20E8AA", bg="#15191F")
-        self.progress_percentage_label.pack()
-
-        # Button to specify wallet directory
-        self.set_wallet_dir_button = tk.Button(root, text="Set Wallet Directory", command=self.set_wallet_directory, bg="#20242B", fg="#20E8AA", relief="flat", borderwidth=0)
-        self.set_wallet_dir_button.pack(pady=10)
-
-        # Button to exit
-        self.exit_button = tk.Button(root, text="Exit", command=root.quit, bg="#20242B", fg="#20E8AA", relief="flat", borderwidth=0)
-        self.exit_button.pack(pady=10)
-
-    def create_wallets(self):
-        count = tk.simpledialog.askinteger("Input", "How many wallets do you want to create?", minvalue=1, maxvalue=100000)
-        if count:
-            self.progress_bar['maximum'] = count
-            create_multiple_wallets(count, self.wallets_directory, self.progress_bar, self.progress_percentage_label)
-            self.wallet_count = get_wallet_count(self.wallets_directory)  # Update wallet count
-            self.wallet_count_label.config(text=f"Current number of wallets: {self.wallet_count}")
-            messagebox.showinfo("Wake up NEO", f"Successfully created {count} wallets!")
-
-    def export_addresses(self):
-        output_directory = filedialog.askdirectory(initialdir=self.output_directory, title="Select Directory to Save Output")
-        if output_directory:
-            output_file = os.path.join(output_directory, "public_addresses.txt")
-            try:
-                export_public_addresses(self.wallets_directory, output_file)
-                messagebox.showinfo("Success", f"Public addresses have been exported to {output_file}")
-            except Exception as e:
-                messagebox.showerror("Error", f"An error occurred: {e}")
-
-    def connect_morpheus_wallet(self):
-        # User will select directory to load the Morpheus wallet
-        wallet_file = filedialog.askopenfilename(title="Select Morpheus Wallet File", filetypes=[("JSON Files", "*.json")])
-        if wallet_file:
-            self.morpheus_wallet.wallet_file = wallet_file
-            try:
-                self.morpheus_wallet.load_wallet()
-                self.wallet_address_label.config(text=f"Morpheus Wallet Address: {self.morpheus_wallet.account.address}")
-                self.gas_balance_label.config(text=f"Gas Balance: {self.morpheus_wallet.get_gas_balance()}")
-                messagebox.showinfo("Wake up NEO", "Morpheus wallet connected successfully")
-            except FileNotFoundError:
-                messagebox.showerror("Error", "Morpheus wallet file not found.")
-
-    def create_morpheus_wallet(self):
-        # Ask user to specify the directory to save the Morpheus wallet
-        directory = filedialog.askdirectory(title="Select Directory for Morpheus Wallet")
-        if directory:
-            self.morpheus_wallet.create_new_wallet(directory=directory)
-            self.wallet_address_label.config(text=f"Morpheus Wallet Address: {self.morpheus_wallet.account.address}")
-            self.gas_balance_label.config(text=f"Gas Balance: {self.morpheus_wallet.get_gas_balance()}")
-            messagebox.showinfo("Wake up NEO", "Morpheus wallet created successfully")
-
-    def set_wallet_directory(self):
-        directory = filedialog.askdirectory(initialdir=self.wallets_directory, title="Select Directory for Wallets")
-        if directory:
-            self.wallets_directory = directory
-            messagebox.showinfo("Success", f"Wallets will be saved to: {self.wallets_directory}")
-
-
-# ------------------------------
-# Main Program Entry Point
-# ------------------------------
-
-if __name__ == "__main__":
-    root = tk.Tk()
-    app = KeyMakerApp(root)
-    root.mainloop()
+import os
+import re
+import json
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import tkinter as tk
+from tkinter import messagebox, filedialog, simpledialog
+from tkinter.ttk import Progressbar
+
+# NOTE: neo3 is imported inside the wallet functions - pulling it in at
+# module top costs seconds before the Tk window can even paint
+
+
+# ------------------------------
+# Wallet Functions Module
+# ------------------------------
+
+_WALLET_NAME_RE = re.compile(r"Matrix_User_(\d+)\.json$")
+
+# Lazily-bound neo3 classes: the import itself is cached by sys.modules,
+# but binding once here also skips the repeated attribute walk through
+# neo3.wallet.wallet on every call in a bulk loop.
+_Wallet = None
+_DiskWallet = None
+
+def _load_neo3():
+    """Import neo3's wallet classes on first use and reuse the bindings after."""
+    global _Wallet, _DiskWallet
+    if _Wallet is None:
+        from neo3.wallet.wallet import Wallet, DiskWallet
+        _Wallet, _DiskWallet = Wallet, DiskWallet
+    return _Wallet, _DiskWallet
+
+def _next_free_index(directory: str = "wallets") -> int:
+    """
+    One os.scandir pass over the directory gives the next free wallet
+    number - replaces the per-wallet while-os.path.exists probing that
+    cost O(N^2) stat calls across a big batch.
+    """
+    if not os.path.isdir(directory):
+        return 0
+    highest = -1
+    for entry in os.scandir(directory):
+        m = _WALLET_NAME_RE.match(entry.name)
+        if m:
+            number = int(m.group(1))
+            if number > highest:
+                highest = number
+    return highest + 1
+
+def create_wallet(wallet_number: int, directory: str = "wallets"):
+    """Creates a new in-memory wallet with one account (Wallet.save ignores paths)."""
+    Wallet, _ = _load_neo3()
+
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    wallet = Wallet()
+    # Provide empty string as password to avoid prompting for one
+    new_account = wallet.account_new(password="", label=f"Matrix_User_{wallet_number}")  # No password required
+
+    wallet.save()  # Save the wallet
+    return wallet
+
+def create_wallet_and_save(wallet_number: int, directory: str = "wallets"):
+    """Creates a new wallet and saves it to a JSON file in the specified directory."""
+    _, DiskWallet = _load_neo3()
+
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    wallet_path = os.path.join(directory, f"Matrix_User_{wallet_number}.json")
+
+    if os.path.exists(wallet_path):
+        wallet_number = _next_free_index(directory)
+        wallet_path = os.path.join(directory, f"Matrix_User_{wallet_number}.json")
+
+    # Write to a sidecar .tmp and rename into place: readers never see a
+    # half-written wallet, and we skip the per-file fsync entirely -
+    # durability for a whole batch comes from one directory fsync in
+    # create_multiple_wallets instead of N metadata flushes.
+    tmp_path = wallet_path + ".tmp"
+    wallet = DiskWallet.default(path=tmp_path)
+    # Provide empty string as password to avoid prompting for one
+    new_account = wallet.account_new(password="", label=f"Matrix_User_{wallet_number}")  # No password required
+    wallet.save()
+    os.replace(tmp_path, wallet_path)
+
+    return wallet
+
+def _write_wallet_json_fast(wallet_number: int, directory: str = "wallets"):
+    """
+    Bulk-path wallet creation: generate one account and write the NEP-6
+    JSON directly.
+
+    create_wallet_and_save builds a full DiskWallet object graph that is
+    thrown away the moment the file hits disk. For batches only the JSON
+    matters, so we create just the Account (keygen + NEP-2 encryption -
+    that part must stay, it's what makes the key recoverable) and
+    assemble the wallet dict ourselves with json.dump. Same tmp+rename
+    idiom as create_wallet_and_save.
+    """
+    from neo3.wallet.account import Account
+
+    label = f"Matrix_User_{wallet_number}"
+    wallet_path = os.path.join(directory, f"{label}.json")
+    if os.path.exists(wallet_path):
+        wallet_number = _next_free_index(directory)
+        label = f"Matrix_User_{wallet_number}"
+        wallet_path = os.path.join(directory, f"{label}.json")
+
+    account = Account.create_new(password="")
+    account.label = label
+
+    data = {
+        "name": label,
+        "version": "1.0",
+        "scrypt": {"n": 16384, "r": 8, "p": 8},
+        "accounts": [account.to_json()],
+        "extra": None,
+    }
+
+    tmp_path = wallet_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fp:
+        json.dump(data, fp)
+    os.replace(tmp_path, wallet_path)
+
+    return wallet_path
+
+def _fsync_directory(directory: str):
+    """Flush directory metadata once for a whole batch of renames (no-op on Windows)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def create_multiple_wallets(count: int, directory: str = "wallets", progress_callback=None):
+    """
+    Creates multiple wallets in the specified directory.
+
+    Key derivation is CPU-bound and independent per wallet, so the work
+    fans out across all cores in a ProcessPoolExecutor. This function
+    touches no Tk widgets (it is meant to run off the GUI thread);
+    `progress_callback` just receives the number of wallets done so far.
+    """
+    # Compute the first free index ONCE; every worker then gets its own
+    # collision-free number with no existence probing in the hot loop
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    start = _next_free_index(directory)
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [
+            executor.submit(_write_wallet_json_fast, i, directory)
+            for i in range(start, start + count)
+        ]
+        for done, future in enumerate(as_completed(futures), 1):
+            future.result()
+            if progress_callback:
+                progress_callback(done)
+
+    # One fsync for the whole batch - all the renames above become
+    # durable together instead of paying a metadata flush per wallet
+    _fsync_directory(directory)
+
+
+def iter_wallets(directory: str = "wallets"):
+    """
+    Yields os.DirEntry objects for the wallet .json files in a directory.
+
+    A generator over scandir keeps memory flat even at 100k wallets (no
+    transient list of names) and hands callers DirEntry objects whose
+    name/type are already cached - is_file() below costs no extra stat.
+    """
+    if not os.path.isdir(directory):
+        return
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.is_file():
+                yield entry
+
+def list_wallets(directory: str = "wallets") -> list:
+    """Lists all wallets in the specified directory."""
+    return os.listdir(directory)
+
+def get_wallet_count(directory: str = "wallets") -> int:
+    """Returns the number of wallet .json files in the specified directory."""
+    return sum(1 for _ in iter_wallets(directory))
+
+def export_public_addresses(directory: str = "wallets", output_file: str = "public_addresses.txt"):
+    """
+    Exports public addresses from all wallets into a .txt file.
+
+    The address is read straight out of each wallet's JSON - going
+    through DiskWallet.from_file rebuilds full account/crypto objects
+    just to fetch one public field.
+    """
+    addresses = []
+    for entry in iter_wallets(directory):
+        with open(entry.path, "r", encoding="utf-8") as fp:
+            wallet_data = json.load(fp)
+        accounts = wallet_data.get("accounts") or [{}]
+        address = accounts[0].get("address")
+        if address:
+            addresses.append(address)
+
+    # One buffered write instead of a line-sized write per wallet
+    with open(output_file, "w") as file:
+        file.write("\n".join(addresses) + ("\n" if addresses else ""))
+    return output_file
+
+
+# ------------------------------
+# Morpheus Wallet Module
+# ------------------------------
+
+class MorpheusWallet:
+    def __init__(self, wallet_file: str = "Morpheus_wallet.json"):
+        self.wallet_file = wallet_file
+        self.wallet = None
+        self.account = None
+        self._cached_address = None
+        self.gas_balance = 100  # Placeholder for gas balance
+
+    @property
+    def address(self):
+        """Public address of the master account (plaintext, no key material needed)."""
+        if self.account is not None:
+            return self.account.address
+        return self._cached_address
+
+    def create_new_wallet(self, directory: str = "wallets"):
+        """Create a new Morpheus wallet and save it to the specified directory."""
+        Wallet, _ = _load_neo3()
+
+        self.wallet = Wallet()
+        self.account = self.wallet.account_new(password="", label="Morpheus_Master")  # No password required
+        self.save_wallet(directory)
+
+    def load_wallet(self, directory: str = "wallets"):
+        """
+        Load an existing Morpheus wallet for display.
+
+        Fast path: the public address sits in plaintext inside the JSON,
+        so we just read it out - DiskWallet.from_file would run scrypt
+        key derivation only to show that same string. The full wallet is
+        materialized lazily by _ensure_loaded() when an operation needs
+        private-key material.
+        """
+        if os.path.exists(self.wallet_file):
+            with open(self.wallet_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._cached_address = data["accounts"][0]["address"]
+            print(f"Loaded Morpheus wallet with address: {self._cached_address}")
+        else:
+            raise FileNotFoundError("Morpheus wallet file does not exist.")
+
+    def _ensure_loaded(self):
+        """Fully load the wallet (scrypt derivation included) for signing-type operations."""
+        _, DiskWallet = _load_neo3()
+
+        if self.wallet is None:
+            self.wallet = DiskWallet.from_file(self.wallet_file)
+            self.account = self.wallet.accounts[0]
+        return self.wallet
+
+    def save_wallet(self, directory: str = "wallets"):
+        """Save the Morpheus wallet to a file."""
+        _, DiskWallet = _load_neo3()
+
+        wallet_path = os.path.join(directory, self.wallet_file)
+        disk_wallet = DiskWallet.default(path=wallet_path)  # Create a DiskWallet
+        disk_wallet.save()  # Save it using DiskWallet's save method
+        print(f"Morpheus wallet saved at {wallet_path}")
+
+    def get_gas_balance(self):
+        """Get the gas balance of the Morpheus wallet."""
+        return self.gas_balance
+
+
+# ------------------------------
+# GUI Module
+# ------------------------------
+
+class KeyMakerApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("KeyMaker Application")
+        self.root.geometry("600x400")  # Wider window to display full address
+        
+        # Set background color of the window
+        self.root.configure(bg="#20242B")
+        
+        # Default directories
+        self.wallets_directory = "wallets"
+        self.output_directory = os.getcwd()  # Current working directory
+        
+        # Morpheus wallet
+        self.morpheus_wallet = MorpheusWallet()
+        
+        # Labels with custom colors
+        self.wallet_address_label = tk.Label(root, text="Wallet Not Connected", font=("Arial", 14), fg="#20E8AA", bg="white", anchor="w")
+        self.wallet_address_label.pack(pady=10, padx=20, fill="x")
+
+        self.wallet_count = get_wallet_count(self.wallets_directory)
+        
+        # Label to show number of wallets
+        self.wallet_count_label = tk.Label(root, text=f"Current number of wallets: {self.wallet_count}", fg="#20E8AA", bg="#15191F")
+        self.wallet_count_label.pack(pady=10)
+
+        # Label to display gas balance of Morpheus
+        self.gas_balance_label = tk.Label(root, text="Gas Balance: Not Connected", font=("Arial", 12), fg="#20E8AA", bg="#15191F")
+        self.gas_balance_label.pack(pady=10)
+
+        # Button to create wallets
+        self.create_wallet_button = tk.Button(root, text="Create Wallets", command=self.create_wallets, bg="#20242B", fg="#20E8AA", relief="flat", borderwidth=0)
+        self.create_wallet_button.pack(pady=10)
+
+        # Button to export public addresses
+        self.export_button = tk.Button(root, text="Export Public Addresses", command=self.export_addresses, bg="#20242B", fg="#20E8AA", relief="flat", borderwidth=0)
+        self.export_button.pack(pady=10)
+
+        # Button to connect Morpheus wallet
+        self.connect_morpheus_button = tk.Button(root, text="Connect Morpheus Wallet", command=self.connect_morpheus_wallet, bg="#20242B", fg="#20E8AA", relief="flat", borderwidth=0)
+        self.connect_morpheus_button.pack(pady=10)
+
+        # Button to create Morpheus wallet
+        self.create_morpheus_button = tk.Button(root, text="Create Morpheus Wallet", command=self.create_morpheus_wallet, bg="#20242B", fg="#20E8AA", relief="flat", borderwidth=0)
+        self.create_morpheus_button.pack(pady=10)
+
+        # Progress bar
+        self.progress_bar = Progressbar(root, length=200, mode='determinate')
+        self.progress_bar.pack(pady=10)
+
+        # Label to show percentage in progress bar
+        self.progress_percentage_label = tk.Label(root, text="0%", font=("Arial", 10), fg="#20E8AA", bg="#15191F")
+        self.progress_percentage_label.pack()
+
+        # Button to specify wallet directory
+        self.set_wallet_dir_button = tk.Button(root, text="Set Wallet Directory", command=self.set_wallet_directory, bg="#20242B", fg="#20E8AA", relief="flat", borderwidth=0)
+        self.set_wallet_dir_button.pack(pady=10)
+
+        # Button to exit
+        self.exit_button = tk.Button(root, text="Exit", command=root.quit, bg="#20242B", fg="#20E8AA", relief="flat", borderwidth=0)
+        self.exit_button.pack(pady=10)
+
+    def create_wallets(self):
+        count = tk.simpledialog.askinteger("Input", "How many wallets do you want to create?", minvalue=1, maxvalue=100000)
+        if count:
+            self.progress_bar['maximum'] = count
+            # Keygen runs on a background thread writing a shared
+            # counter; the GUI polls it at ~20 Hz via after() instead of
+            # pumping the whole event loop once per wallet
+            self._progress_done = 0
+            self._creation_running = True
+
+            def worker():
+                try:
+                    create_multiple_wallets(count, self.wallets_directory,
+                                            progress_callback=self._set_progress_done)
+                finally:
+                    self._creation_running = False
+
+            threading.Thread(target=worker, daemon=True).start()
+            self.root.after(50, lambda: self._poll_wallet_progress(count))
+
+    def _set_progress_done(self, done):
+        """Called from the worker thread - plain attribute write only."""
+        self._progress_done = done
+
+    def _poll_wallet_progress(self, count):
+        done = self._progress_done
+        self.progress_bar['value'] = done
+        self.progress_percentage_label.config(text=f"{int(done / count * 100)}%")
+
+        if self._creation_running:
+            self.root.after(50, lambda: self._poll_wallet_progress(count))
+            return
+
+        # We know exactly how many were created - bump the in-memory
+        # count instead of re-scanning the wallet directory
+        self.wallet_count += done
+        self.wallet_count_label.config(text=f"Current number of wallets: {self.wallet_count}")
+        messagebox.showinfo("Wake up NEO", f"Successfully created {count} wallets!")
+
+    def export_addresses(self):
+        output_directory = filedialog.askdirectory(initialdir=self.output_directory, title="Select Directory to Save Output")
+        if output_directory:
+            output_file = os.path.join(output_directory, "public_addresses.txt")
+            try:
+                export_public_addresses(self.wallets_directory, output_file)
+                messagebox.showinfo("Success", f"Public addresses have been exported to {output_file}")
+            except Exception as e:
+                messagebox.showerror("Error", f"An error occurred: {e}")
+
+    def connect_morpheus_wallet(self):
+        # User will select directory to load the Morpheus wallet
+        wallet_file = filedialog.askopenfilename(title="Select Morpheus Wallet File", filetypes=[("JSON Files", "*.json")])
+        if wallet_file:
+            self.morpheus_wallet.wallet_file = wallet_file
+            try:
+                self.morpheus_wallet.load_wallet()
+                self.wallet_address_label.config(text=f"Morpheus Wallet Address: {self.morpheus_wallet.address}")
+                self.gas_balance_label.config(text=f"Gas Balance: {self.morpheus_wallet.get_gas_balance()}")
+                messagebox.showinfo("Wake up NEO", "Morpheus wallet connected successfully")
+            except FileNotFoundError:
+                messagebox.showerror("Error", "Morpheus wallet file not found.")
+
+    def create_morpheus_wallet(self):
+        # Ask user to specify the directory to save the Morpheus wallet
+        directory = filedialog.askdirectory(title="Select Directory for Morpheus Wallet")
+        if directory:
+            self.morpheus_wallet.create_new_wallet(directory=directory)
+            self.wallet_address_label.config(text=f"Morpheus Wallet Address: {self.morpheus_wallet.address}")
+            self.gas_balance_label.config(text=f"Gas Balance: {self.morpheus_wallet.get_gas_balance()}")
+            messagebox.showinfo("Wake up NEO", "Morpheus wallet created successfully")
+
+    def set_wallet_directory(self):
+        directory = filedialog.askdirectory(initialdir=self.wallets_directory, title="Select Directory for Wallets")
+        if directory:
+            self.wallets_directory = directory
+            # New directory => one fresh scan, then back to in-memory counting
+            self.wallet_count = get_wallet_count(directory)
+            self.wallet_count_label.config(text=f"Current number of wallets: {self.wallet_count}")
+            messagebox.showinfo("Success", f"Wallets will be saved to: {self.wallets_directory}")
+
+
+# ------------------------------
+# Main Program Entry Point
+# ------------------------------
+
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = KeyMakerApp(root)
+    root.mainloop()
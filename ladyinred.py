@@ -12,39 +12,105 @@ In KeyMaker:
   The 'LIR' console command calls this script.
 """
 
+import mmap
 import os
 import sys
 import subprocess
-
-import onnxruntime as ort
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # This function is optional—just to show you can test onnxruntime
 def check_cuda():
     """
-    Quick check if onnxruntime can load a dummy session with CUDA providers.
+    Quick capability probe: does onnxruntime advertise a CUDA provider?
+    No InferenceSession needed - the old dummy-path session spent 1-3 s
+    loading provider DLLs just to fail on a file that doesn't exist.
     """
     try:
-        # Providers you want in order of priority
-        providers = ["CUDAExecutionProvider", "CPUExecutionProvider"]
+        # Imported here so launching without the check (or without ORT
+        # installed) doesn't pay the heavy module load
+        import onnxruntime as ort
+
+        providers = ort.get_available_providers()
+        if "CUDAExecutionProvider" in providers:
+            print("[LadyInRed] CUDA check: CUDAExecutionProvider available =>", providers)
+        else:
+            print("[LadyInRed] CUDA check: no CUDA provider, CPU only =>", providers)
+    except Exception as e:
+        print("[LadyInRed] Warning: CUDA check raised an exception:", e)
 
-        # We'll do a trivial check. If you have an actual .onnx model, set it here
-        # or skip if you only want to test the environment.
-        dummy_model = "path/to/a/tiny/model.onnx"
 
-        # Initialize session
-        ort_session = ort.InferenceSession(dummy_model, providers=providers)
+def _prefetch_one(path):
+    """
+    Pull a single model file into the OS page cache.
+    On Linux, MAP_POPULATE makes the kernel fault the whole mapping in
+    eagerly; elsewhere we fall back to a plain sequential read (the
+    read-ahead heuristics do the rest). Either way the bytes are warm
+    before FaceFusion opens the file.
+    """
+    try:
+        with open(path, "rb") as f:
+            if hasattr(mmap, "MAP_POPULATE"):
+                mm = mmap.mmap(
+                    f.fileno(), 0,
+                    flags=mmap.MAP_PRIVATE | mmap.MAP_POPULATE,
+                    prot=mmap.PROT_READ,
+                )
+                mm.close()
+            else:
+                # 64 MB chunks: big enough to stream, small enough to
+                # not blow up memory for multi-GB weights
+                while f.read(64 * 1024 * 1024):
+                    pass
+    except (OSError, ValueError):
+        pass  # prefetch is best-effort; FaceFusion reads it anyway
+
+
+def _prefetch_models(models_dir):
+    """
+    Warm the page cache for all model weights under models_dir in
+    parallel worker threads, so FaceFusion's first inference isn't
+    stuck on cold-disk reads layer by layer. Fire-and-forget: runs
+    while FaceFusion itself is still booting.
+    """
+    if not os.path.isdir(models_dir):
+        return
 
-        # If no error => we presumably can run CUDA
-        print("[LadyInRed] CUDA check: onnxruntime created session with providers =>", ort_session.get_providers())
-    except Exception as e:
-        print("[LadyInRed] Warning: CUDA check raised an exception:", e)
+    targets = []
+    for root, _dirs, files in os.walk(models_dir):
+        for name in files:
+            if name.endswith((".onnx", ".safetensors")):
+                targets.append(os.path.join(root, name))
+
+    if not targets:
+        return
+
+    print(f"[LadyInRed] Prefetching {len(targets)} model file(s) into page cache...")
+    pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="lir_prefetch")
+    for path in targets:
+        pool.submit(_prefetch_one, path)
+    pool.shutdown(wait=False)
+
+
+def _reap(proc):
+    """
+    Background watcher: wait for FaceFusion to exit and log its code.
+    Keeps the Popen from lingering as a zombie without blocking callers.
+    """
+    code = proc.wait()
+    print(f"[LadyInRed] FaceFusion exited with code {code}.")
 
 
 def launch_facefusion():
     """
-    Runs "python facefusion.py run --open-browser" from F:\KeyMaker\facefusion,
+    Spawns "python facefusion.py run --open-browser" from F:\KeyMaker\facefusion,
     using the same Python environment that launched ladyinred.py,
     and requesting CUDA if available.
+
+    Returns the Popen handle immediately - FaceFusion is an interactive
+    server that runs until closed, so blocking here would freeze whoever
+    called us (e.g. the KeyMaker console). Call .terminate() on the
+    returned handle to shut it down.
     """
     # Optionally do a quick environment check:
     check_cuda()
@@ -60,15 +126,18 @@ def launch_facefusion():
     # But this depends on FaceFusion's CLI design. If there's no such option,
     # we rely on an internal facefusion config or .ini to set providers.
 
-    cmd = f'cd "{facefusion_dir}" && "{python_cmd}" facefusion.py run --open-browser'
-    print(f"[LadyInRed] Launching FaceFusion with:\n{cmd}")
+    # Direct spawn with cwd= - no cmd.exe/bash shim just to chdir, and
+    # no quoting bugs if the path grows odd characters
+    # Start streaming the model weights off disk while FaceFusion boots;
+    # by the time CUDA init is done the weights are (mostly) cached.
+    _prefetch_models(os.path.join(facefusion_dir, ".assets", "models"))
+
+    cmd = [python_cmd, "facefusion.py", "run", "--open-browser"]
+    print(f"[LadyInRed] Launching FaceFusion with:\n{' '.join(cmd)} (cwd={facefusion_dir})")
 
-    if os.name == 'nt':
-        # On Windows, shell=True uses cmd.exe
-        subprocess.run(cmd, shell=True)
-    else:
-        # On Unix/Mac, specify a shell if needed
-        subprocess.run(cmd, shell=True, executable='/bin/bash')
+    proc = subprocess.Popen(cmd, cwd=facefusion_dir)
+    threading.Thread(target=_reap, args=(proc,), daemon=True).start()
+    return proc
 
 
 def main():
@@ -84,7 +153,15 @@ def main():
         # if "run" in sys.argv => do the same anyway
         pass
 
-    launch_facefusion()
+    proc = launch_facefusion()
+
+    # Standalone invocation: stay alive until the server closes, so
+    # Ctrl+C in this terminal still tears FaceFusion down.
+    try:
+        proc.wait()
+    except KeyboardInterrupt:
+        proc.terminate()
+        proc.wait()
 
 
 if __name__ == "__main__":
@@ -1,12 +1,64 @@
 import os
+import functools
+import queue
 import tkinter as tk
-from threading import Lock
+from collections import deque
+from threading import Thread
 from random import choice, randrange, random, randint
+import numpy as np
+# Optional: pillow-simd is a drop-in Pillow replacement with SSE4/AVX2
+# kernels (pip uninstall pillow && pip install pillow-simd). Everything
+# used here - Image.new, draw.text, frombuffer, paste - works unchanged
+# and the glyph rasterization + per-frame upload get the SIMD paths.
 from PIL import Image, ImageDraw, ImageFont, ImageTk
 import time
 import textwrap
 import math
 
+###############################################################################
+# Glyph cache
+###############################################################################
+
+# Shining amplitude LUT: 0.7 + 0.3*sin over one period, 1024 entries.
+# Indexing with a mask replaces a libm sin + two float ops per shining
+# symbol per frame. .tolist() so lookups return plain Python floats.
+_LUT_SCALE = 1024 / (2.0 * math.pi)
+_AMP_LUT = (0.7 + 0.3 * np.sin(np.linspace(0, 2.0 * math.pi, 1024, endpoint=False))).tolist()
+
+@functools.lru_cache(maxsize=8192)
+def _render_glyph(ch, rgb, font):
+    """
+    Rasterize one colored glyph into a 30x30 uint8 RGB array, cached
+    process-wide.
+
+    The alphabet is ~96 katakana plus some ASCII, and callers quantize
+    the color to 16-step channels, so after a second of play nearly
+    every frame is pure dict hits instead of FreeType rasterization.
+    """
+    img = Image.new("RGB", (30, 30), (0, 0, 0))
+    ImageDraw.Draw(img).text((0, 0), ch, font=font, fill=rgb)
+    return np.asarray(img, dtype=np.uint8)
+
+
+def _blit(fb, glyph, x, y):
+    """
+    Composite one glyph array into the framebuffer at (x, y), clipped.
+
+    The background is black and symbols barely overlap, so a max-blend
+    is both correct-looking and a single vectorized NumPy op - no
+    per-pixel Python and no alpha channel to carry around.
+    """
+    h, w = fb.shape[:2]
+    gh, gw = glyph.shape[:2]
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + gw, w), min(y + gh, h)
+    if x0 >= x1 or y0 >= y1:
+        return
+    dst = fb[y0:y1, x0:x1]
+    src = glyph[y0 - y:y1 - y, x0 - x:x1 - x]
+    np.maximum(dst, src, out=dst)
+
+
 ###############################################################################
 # Symbol
 ###############################################################################
@@ -17,6 +69,22 @@ class Symbol:
     If system_failure_in_progress => partial red.
     If reverse_in_progress => interpret ratio backwards => symmetrical color path.
     """
+
+    # One FreeType face per (path, size), shared by every symbol. ~400
+    # private faces per screen defeated FreeType's own glyph cache and
+    # cost an os.path.exists + truetype() in each constructor.
+    _FONT_CACHE = {}
+
+    @classmethod
+    def _load_font(cls, font_path, size=20):
+        key = (font_path, size)
+        font = cls._FONT_CACHE.get(key)
+        if font is None:
+            if not os.path.exists(font_path):
+                font_path = "arial.ttf"
+            font = cls._FONT_CACHE[key] = ImageFont.truetype(font_path, size)
+        return font
+
     def __init__(self, x, y, speed, canvas, font_path, is_console=False):
         self.x = x
         self.y = y
@@ -31,13 +99,10 @@ class Symbol:
             self.color = (0, g_val, 0)
 
         self.alpha = 0
-        self.text_id = None
         self.value = self.random_katakana()
 
-        # Fallback font
-        if not os.path.exists(font_path):
-            font_path = "arial.ttf"
-        self.font = ImageFont.truetype(font_path, 20)
+        # Shared font (fallback handling lives in _load_font)
+        self.font = self._load_font(font_path)
 
         # partial red
         self.max_red_ratio = 0.5 + 0.5 * random()
@@ -62,40 +127,30 @@ class Symbol:
             syms.append(chr(b + offset))
         return syms
 
-    def draw(self):
+    def draw(self, fb):
         matrix_error_mode = getattr(self.canvas, "matrix_error_mode", False)
         stop_y_movement = getattr(self.canvas, "stop_y_movement", False)
-        fail_ratio = getattr(self.canvas, "system_failure_ratio", 0.0)
-        reverse_in_progress = getattr(self.canvas, "reverse_in_progress", False)
 
         # if not freeze => fall
+        # (fb_height is a plain attr set by Matrix - readable from the
+        # render thread, unlike the winfo_height() Tk call)
         if not (matrix_error_mode and stop_y_movement):
-            if self.y >= self.canvas.winfo_height():
+            if self.y >= getattr(self.canvas, "fb_height", 0):
                 self.y = -20
             else:
                 self.y += self.speed
 
-        if self.text_id:
-            self.canvas.delete(self.text_id)
-
         # fade in alpha
         if self.alpha < 255:
             self.alpha += 15
             if self.alpha > 255:
                 self.alpha = 255
 
-        # build an RGBA image
-        img = Image.new("RGBA", (30, 30), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-
         if matrix_error_mode:
-            exponent = 1.7
-            if not reverse_in_progress:
-                # forward => ratio^exponent
-                R = fail_ratio ** exponent
-            else:
-                # reverse => 1 - ratio^exponent
-                R = 1.0 - (fail_ratio ** exponent)
+            # Matrix computes ratio**1.7 (and the reverse flip) once per
+            # frame and shares it here - one pow per frame instead of
+            # one per symbol
+            R = getattr(self.canvas, "failure_R", 0.0)
 
             def blend(a, b, rv):
                 return int(a * (1 - rv) + b * rv)
@@ -111,19 +166,24 @@ class Symbol:
         else:
             final_col = self._apply_shining(self.color)
 
-        alph = int(min(255, self.alpha))
-        c_blend = tuple(int(c * (alph / 255)) for c in final_col)
+        # Quantize the blended color to 16-step channels (& 0xF0):
+        # visually indistinguishable during the fade, but it collapses
+        # the cache key space so _render_glyph almost always hits.
+        # Steady state (alpha=255, i.e. almost every symbol almost
+        # every frame) skips the premultiply entirely; the fade path
+        # uses pure integer math - no float round-trip per channel.
+        if self.alpha >= 255:
+            c_blend = (final_col[0] & 0xF0, final_col[1] & 0xF0, final_col[2] & 0xF0)
+        else:
+            alph = self.alpha
+            c_blend = tuple((c * alph // 255) & 0xF0 for c in final_col)
 
-        draw.text((0, 0), self.value, font=self.font, fill=c_blend)
-        self.tk_img = ImageTk.PhotoImage(img)
-        self.text_id = self.canvas.create_image(
-            self.x, self.y, image=self.tk_img, anchor="nw"
-        )
+        _blit(fb, _render_glyph(self.value, c_blend, self.font), int(self.x), int(self.y))
 
     def _apply_shining(self, base_color):
         if self.is_tip or self.is_shining:
             self.blink_phase += 0.2 * self.blink_freq
-            amp = 0.7 + 0.3 * math.sin(self.blink_phase + self.blink_phase_off)
+            amp = _AMP_LUT[int((self.blink_phase + self.blink_phase_off) * _LUT_SCALE) & 1023]
             rc = int(base_color[0] * amp)
             gc = int(base_color[1] * amp)
             bc = int(base_color[2] * amp)
@@ -153,9 +213,22 @@ class TransformingSymbol(Symbol):
         ascii_syms = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*()"
         return [choice(ascii_syms) for _ in range(10)]
 
-    def draw(self):
+    def reset(self, x, y, speed, final_char):
+        """Reinitialize a pooled symbol for a fresh console line."""
+        self.x = x
+        self.y = y
+        self.speed = speed
+        self.final_char = final_char
+        self.value = self.random_katakana()
+        self.alpha = 0
+        self.transform_steps = 35
+        self.transformed = False
+        self.fading_out = False
+        self.blink_phase = 0.0
+
+    def draw(self, fb):
         if getattr(self.canvas, "matrix_error_mode", False):
-            super().draw()
+            super().draw(fb)
             return
 
         if not self.transformed and self.transform_steps > 0:
@@ -172,14 +245,15 @@ class TransformingSymbol(Symbol):
             syms = super().generate_symbols()
             self.value = choice(syms)
 
-        super().draw()
+        super().draw(fb)
 
 
 ###############################################################################
 # ConsoleText
 ###############################################################################
 class ConsoleText:
-    def __init__(self, canvas, text, font_path, duration_ms=12000):
+    def __init__(self, canvas, text, font_path, duration_ms=12000, pool=None,
+                 wrapped_lines=None):
         self.canvas = canvas
         self.text = text
         self.font_path = font_path
@@ -187,9 +261,15 @@ class ConsoleText:
         self.active = True
         self.start_time = None
         self.symbols = []
+        # Shared TransformingSymbol pool (owned by Matrix): retired
+        # symbols get reset and reused instead of reconstructed per line
+        self.pool = pool if pool is not None else deque()
 
-        max_chars = 29
-        lines = textwrap.fill(text, max_chars).split("\n")
+        # flush_aggregator already wrapped the text to size its line
+        # gap; reuse its rows rather than running textwrap twice
+        if wrapped_lines is None:
+            wrapped_lines = textwrap.wrap(text, 29) or [text]
+        lines = wrapped_lines
 
         x_offset = (canvas.winfo_width() - len(lines[0]) * 20) // 2
         if x_offset < 0:
@@ -199,20 +279,25 @@ class ConsoleText:
 
         for j, row in enumerate(lines):
             for i, ch in enumerate(row):
-                ts = TransformingSymbol(
-                    x_offset + i * 20,
-                    y_offset + j * row_spacing,
-                    speed=2.5,
-                    canvas=self.canvas,
-                    final_char=ch,
-                    font_path=self.font_path,
-                    is_console=True,
-                )
-                if random() < 0.1:
-                    ts.is_shining = True
+                x = x_offset + i * 20
+                y = y_offset + j * row_spacing
+                if self.pool:
+                    ts = self.pool.popleft()
+                    ts.reset(x, y, 2.5, ch)
+                else:
+                    ts = TransformingSymbol(
+                        x,
+                        y,
+                        speed=2.5,
+                        canvas=self.canvas,
+                        final_char=ch,
+                        font_path=self.font_path,
+                        is_console=True,
+                    )
+                ts.is_shining = random() < 0.1
                 self.symbols.append(ts)
 
-    def draw(self):
+    def draw(self, fb):
         if self.start_time is None:
             self.start_time = time.time()
 
@@ -226,7 +311,7 @@ class ConsoleText:
         for sym in self.symbols:
             if e > fade_start:
                 sym.fading_out = True
-            sym.draw()
+            sym.draw(fb)
 
         if e > self.duration:
             self.active = False
@@ -258,9 +343,9 @@ class SymbolColumn:
 
         self.symbols = tmp_syms
 
-    def draw(self):
+    def draw(self, fb):
         for sym in self.symbols:
-            sym.draw()
+            sym.draw(fb)
 
 
 ###############################################################################
@@ -299,10 +384,39 @@ class Matrix:
             for x in range(start_x, start_x + col_count*col_spacing, col_spacing)
         ]
 
+        # console_texts is owned exclusively by the render thread; the
+        # Tk side hands fresh lines over via _incoming_texts (atomic
+        # deque ops, same scheme as the aggregator). Retired symbols go
+        # back into _symbol_pool for the next line.
         self.console_texts = []
+        self._incoming_texts = deque()
+        self._symbol_pool = deque()
         self.running = False
 
-        self.aggregator_lines = []
+        # Single full-canvas framebuffer: every symbol NumPy-blits into
+        # this array and one PhotoImage.paste pushes the whole frame to
+        # one canvas item - instead of ~430 items mutated per tick
+        self._fb = np.zeros((height, width, 3), dtype=np.uint8)
+        self._photo = ImageTk.PhotoImage(Image.fromarray(self._fb))
+        self._photo_item = self.canvas.create_image(
+            0, 0, image=self._photo, anchor="nw"
+        )
+        self.canvas.fb_height = height  # thread-safe height for Symbol.draw
+
+        # Rasterization runs on its own thread; completed frames land in
+        # a 2-deep queue and the Tk side only uploads the newest one.
+        # put_nowait + Full => drop the frame rather than queue latency.
+        self._frame_q = queue.Queue(maxsize=2)
+        self._render_thread = None
+        self._last_tick_ts = None
+
+        # Bounded => bursty log spam silently drops the oldest lines
+        # instead of growing without limit between flushes.
+        # deque append/popleft are atomic in CPython, so producer
+        # (queue_message, any thread) and consumer (Tk tick) need no
+        # lock - the old Lock cost 60 acquire/releases a second on the
+        # UI thread just to read a length.
+        self.aggregator_lines = deque(maxlen=64)
         self.aggregator_start = None
         self.aggregator_duration = 3.0
         self.aggregator_size_limit = 3
@@ -312,14 +426,16 @@ class Matrix:
         # system failure
         self.canvas.matrix_error_mode = False
         self.canvas.system_failure_ratio = 0.0
+        self.canvas.failure_R = 0.0  # ratio**1.7, shared by all symbols
         self.canvas.system_failure_frozen = False
         self.canvas.stop_y_movement = False
         self.canvas.reverse_in_progress = False  # for symmetrical revert
 
         self.system_failure_in_progress = False
         self.system_failure_start = None
-
-        self.lock = Lock()
+        # Visibility of the blinking box last frame - it only toggles
+        # every 500 ms, so 29 of 30 ticks can skip the canvas ops
+        self._last_box_visible = None
 
     def queue_message(self, text: str):
         lw = text.lower()
@@ -328,9 +444,8 @@ class Matrix:
         elif self.system_failure_in_progress:
             self.stop_system_failure()
         else:
-            with self.lock:
-                self.aggregator_lines.append(text)
-                self.aggregator_start = time.time()
+            self.aggregator_lines.append(text)
+            self.aggregator_start = time.time()
         print("Matrix => queued:", text)
 
     def start_system_failure(self):
@@ -351,6 +466,7 @@ class Matrix:
         print("Matrix: stopping system failure => revert color to green now.")
         self.system_failure_in_progress = False
         self.canvas.delete("system_failure_box")
+        self._last_box_visible = None
         self.canvas.stop_y_movement = True
         self.revert_rainfall_to_green()
 
@@ -368,12 +484,14 @@ class Matrix:
         def step_rev(i):
             frac = i / float(steps)
             self.canvas.system_failure_ratio = frac
+            self.canvas.failure_R = 1.0 - (frac ** 1.7)
 
             if i < steps:
                 self.canvas.after(step_dt, step_rev, i + 1)
             else:
                 # done => normal
                 self.canvas.system_failure_ratio = 0.0
+                self.canvas.failure_R = 0.0
                 self.canvas.matrix_error_mode = False
                 self.canvas.system_failure_frozen = False
                 self.canvas.stop_y_movement = False
@@ -385,31 +503,90 @@ class Matrix:
     def start(self):
         print("Matrix: start aggregator + immediate system failure blinking @60FPS.")
         self.running = True
+        self._render_thread = Thread(
+            target=self._render_loop, name="matrix_render", daemon=True
+        )
+        self._render_thread.start()
         self.update()
 
     def stop(self):
         print("Matrix: stopping.")
         self.running = False
 
+    def _render_loop(self):
+        """
+        Worker thread: advance symbol state, rasterize the frame, hand
+        the finished RGB bytes to the Tk side. Touches no Tk API - only
+        plain attributes on the canvas object and the NumPy buffer.
+        """
+        budget = 1.0 / 60.0
+        while self.running:
+            t0 = time.time()
+
+            fb = self._fb
+            if not self.canvas.system_failure_frozen:
+                fb.fill(0)
+                for col in self.columns:
+                    col.draw(fb)
+
+            # Pick up lines queued by the Tk side
+            while True:
+                try:
+                    self.console_texts.append(self._incoming_texts.popleft())
+                except IndexError:
+                    break
+
+            if self.console_texts:
+                # Compact in one pass instead of .remove scans; dead
+                # texts donate their symbols back to the pool
+                still_active = []
+                for ct in self.console_texts:
+                    ct.draw(fb)
+                    if ct.active:
+                        still_active.append(ct)
+                    else:
+                        self._symbol_pool.extend(ct.symbols)
+                        ct.symbols = []
+                self.console_texts = still_active
+
+            try:
+                self._frame_q.put_nowait(fb.tobytes())
+            except queue.Full:
+                pass  # UI is behind => drop this frame, keep latency flat
+
+            elapsed = time.time() - t0
+            if elapsed < budget:
+                time.sleep(budget - elapsed)
+
     def update(self):
         if not self.running:
             return
 
-        if not self.canvas.system_failure_frozen:
-            for col in self.columns:
-                col.draw()
-
-        for ct in self.console_texts[:]:
-            ct.draw()
-            if not ct.active:
-                self.console_texts.remove(ct)
+        # Drain to the newest completed frame; older queued frames are
+        # stale and not worth a PhotoImage upload
+        frame = None
+        while True:
+            try:
+                frame = self._frame_q.get_nowait()
+            except queue.Empty:
+                break
+        if frame is not None:
+            self._photo.paste(
+                Image.frombuffer("RGB", (self.width, self.height), frame)
+            )
 
         if self.system_failure_in_progress:
             self.animate_failure()
         else:
             self.check_aggregator()
 
-        self.canvas.after(16, self.update)
+        # Adaptive reschedule: if this tick blew its 16 ms budget
+        # (slow PhotoImage upload, busy event loop), shorten the next
+        # wait instead of letting the overshoot accumulate as lag.
+        now = time.time()
+        overshoot_ms = int((now - (self._last_tick_ts or now)) * 1000) - 16
+        self._last_tick_ts = now
+        self.canvas.after(max(1, 16 - max(0, overshoot_ms)), self.update)
 
     def animate_failure(self):
         e = time.time() - (self.system_failure_start or 0)
@@ -417,6 +594,7 @@ class Matrix:
 
         if e < 2.0:
             self.canvas.system_failure_ratio = 0.0
+            self.canvas.failure_R = 0.0
             self.canvas.stop_y_movement = False
             self.canvas.system_failure_frozen = False
         elif e < 5.0:
@@ -425,11 +603,14 @@ class Matrix:
             if ratio > 1.0:
                 ratio = 1.0
             self.canvas.system_failure_ratio = ratio
+            # one pow per frame, read by every symbol this tick
+            self.canvas.failure_R = ratio ** 1.7
             self.canvas.system_failure_frozen = False
         else:
             # indefinite final partial red flicker
             self.canvas.stop_y_movement = True
             self.canvas.system_failure_ratio = 1.0
+            self.canvas.failure_R = 1.0
             self.canvas.system_failure_frozen = False
 
     def draw_system_failure_box(self, e):
@@ -442,10 +623,13 @@ class Matrix:
         x2 = x1 + bw
         y2 = y1 + bh
 
-        self.canvas.delete("system_failure_box")
-
         half_cycle = int(e // 0.5)
         visible = (half_cycle % 2 == 0)
+        if visible == self._last_box_visible:
+            return  # no parity change => identical frame, skip canvas ops
+        self._last_box_visible = visible
+
+        self.canvas.delete("system_failure_box")
         if visible:
             self.canvas.create_rectangle(
                 x1,
@@ -469,31 +653,39 @@ class Matrix:
     def check_aggregator(self):
         if self.system_failure_in_progress:
             return
-        with self.lock:
-            if self.aggregator_lines:
-                c = len(self.aggregator_lines)
-                if c >= self.aggregator_size_limit:
-                    self.flush_aggregator()
-                else:
-                    if (time.time() - (self.aggregator_start or 0)) >= self.aggregator_duration:
-                        self.flush_aggregator()
+        if self.aggregator_lines:
+            c = len(self.aggregator_lines)
+            if c >= self.aggregator_size_limit:
+                self.flush_aggregator()
+            elif (time.time() - (self.aggregator_start or 0)) >= self.aggregator_duration:
+                self.flush_aggregator()
 
     def flush_aggregator(self):
-        lines = self.aggregator_lines[:]
-        self.aggregator_lines.clear()
+        # popleft-until-empty instead of list()+clear(): a line appended
+        # by another thread mid-flush lands in the next flush, not the bin
+        lines = []
+        while True:
+            try:
+                lines.append(self.aggregator_lines.popleft())
+            except IndexError:
+                break
         self.aggregator_start = None
 
         now_time = time.time()
         for line in lines:
-            row_count = self.get_wrapped_line_count(line)
+            # Wrap once here; the rows feed both the gap sizing and the
+            # ConsoleText construction below
+            wrapped = textwrap.wrap(line, 29) or [line]
+            row_count = len(wrapped)
             line_gap = row_count * self.base_per_row_gap
 
-            def show_line(ln=line):
+            def show_line(ln=line, rows=wrapped):
                 if not self.system_failure_in_progress:
                     ctext = ConsoleText(
-                        self.canvas, ln, self.font_path, duration_ms=12000
+                        self.canvas, ln, self.font_path, duration_ms=12000,
+                        pool=self._symbol_pool, wrapped_lines=rows,
                     )
-                    self.console_texts.append(ctext)
+                    self._incoming_texts.append(ctext)
                 print(f"Matrix: displayed => {ln} (rows={row_count}, gap={line_gap}s)")
 
             now = time.time()
@@ -506,8 +698,3 @@ class Matrix:
             self.next_line_time = max(self.next_line_time, now) + line_gap
 
         print("Matrix: aggregator flush =>", lines)
-
-    def get_wrapped_line_count(self, line):
-        max_chars = 29  # matching the wrap length in ConsoleText
-        wrapped = textwrap.fill(line, max_chars).split("\n")
-        return len(wrapped)
@@ -3,6 +3,7 @@ import threading
 import queue
 import os
 import time
+from collections import deque
 
 
 class NeoCliManager:
@@ -16,7 +17,10 @@ class NeoCliManager:
         self.cli_path = cli_path
         self.process = None
         self.output_queue = queue.Queue()
-        self.output_lines = []  # Stores CLI output for reference
+        self._prompt_event = threading.Event()  # set by reader on each "neo>" prompt
+        # Bounded: a long CLI session would otherwise grow this forever;
+        # 10k lines is plenty of scrollback for the 10-line display
+        self.output_lines = deque(maxlen=10_000)
         self.console_log = console_log or self._default_console_log  # Function to log to console
         self.awaiting_password = False  # Tracks if CLI is awaiting a password input
 
@@ -48,6 +52,11 @@ class NeoCliManager:
                 self.output_queue.put(line)
                 self.output_lines.append(line.strip())
 
+                # Wake any _collect_output waiter: the CLI printing its
+                # prompt means the previous command finished
+                if "neo>" in line:
+                    self._prompt_event.set()
+
                 # Debugging: Capture CLI prompts or password-related events
                 if "password:" in line.lower():
                     self.awaiting_password = True
@@ -76,29 +85,40 @@ class NeoCliManager:
             return f"Error executing CLI command '{command}': {e}"
 
     def _collect_output(self, timeout):
-        """Collect output from Neo-CLI with a timeout."""
-        output = []
-        start_time = time.time()
-        prompt_detected = False
+        """
+        Collect output from Neo-CLI with a timeout.
 
-        while time.time() - start_time < timeout:
-            try:
-                line = self.output_queue.get(timeout=1)
+        Edge-triggered: drain whatever the reader thread has queued,
+        and if no prompt has arrived yet, block on the prompt event
+        instead of 1-second queue polls. Responses come back at the
+        CLI's actual latency rather than padded to the poll interval.
+        """
+        output = []
+        deadline = time.time() + timeout
+
+        while True:
+            # Clear before draining: a prompt queued after the drain
+            # re-sets the event, so the wait below can't miss it
+            self._prompt_event.clear()
+
+            prompt_seen = False
+            while True:
+                try:
+                    line = self.output_queue.get_nowait()
+                except queue.Empty:
+                    break
                 output.append(line.strip())
-
-                # Detect CLI prompt and ensure no lines are missed
                 if "neo>" in line:
-                    if prompt_detected:
-                        break
-                    prompt_detected = True
-            except queue.Empty:
-                break
+                    prompt_seen = True
 
-        # Handle potential incomplete output
-        if not prompt_detected:
-            output.append("CLI Output: Incomplete response or timeout.")
+            if prompt_seen:
+                # CLI is back at its prompt => the command is done
+                return "\n".join(output)
 
-        return "\n".join(output)
+            remaining = deadline - time.time()
+            if remaining <= 0 or not self._prompt_event.wait(remaining):
+                output.append("CLI Output: Incomplete response or timeout.")
+                return "\n".join(output)
 
     def connect_wallet(self, wallet_path):
         """
@@ -146,7 +166,7 @@ class NeoCliManager:
         """
         self.stop()
         self.output_queue = queue.Queue()  # Clear the output queue
-        self.output_lines = []  # Reset the output lines
+        self.output_lines.clear()  # Reset the output lines
 
     def execute_custom_command(self, command, timeout=10):
         """Send a custom command to Neo-CLI."""
@@ -158,4 +178,6 @@ class NeoCliManager:
 
         :return: Last 10 lines of output.
         """
-        return self.output_lines[-10:]  # Return the last 10 lines for context
+        lines = self.output_lines
+        # deques don't slice; walk back at most 10 entries instead
+        return [lines[i] for i in range(max(0, len(lines) - 10), len(lines))]
@@ -1,5 +1,6 @@
+import os
+import zipfile
 import pyzipper
-from datetime import datetime
 from collections import defaultdict
 import random
 
@@ -15,10 +16,12 @@ class StatsManager:
         :param password:    The vault password (string or bytes).
         """
         self.vault_path = vault_path
-        if isinstance(password, str):
-            self.password = password.encode()
-        else:
-            self.password = password
+        # Already bytes when handed down from Vault.set_vault
+        self.password = password.encode() if isinstance(password, str) else password
+
+        # Chart data cached until the vault file actually changes, so
+        # "Update Charts" doesn't reopen the AES zip every click
+        self._trend_cache = (None, None)
 
     def get_wallet_transactions(self):
         """
@@ -53,15 +56,40 @@ class StatsManager:
           - empty_counts: complement of full_counts
         """
         try:
+            st = os.stat(self.vault_path)
+            stamp = (st.st_mtime_ns, st.st_size)
+            cached, cached_stamp = self._trend_cache
+            if cached is not None and cached_stamp == stamp:
+                return cached
+
             wallet_counts = defaultdict(int)
+            # Batch wallets share creation days, so format each distinct
+            # (y, m, d) once - f-string int formatting skips the whole
+            # datetime construction + locale-aware strftime per entry
+            date_keys = {}
+
+            # The central directory (where date_time lives) is stored in
+            # the clear even in WZ_AES archives, so a plain ZipFile read
+            # gets the metadata without any AES key setup. Only fall
+            # back to pyzipper if the archive trips up stock zipfile.
+            try:
+                with zipfile.ZipFile(self.vault_path, 'r') as zf:
+                    infos = zf.infolist()
+            except Exception:
+                with pyzipper.AESZipFile(self.vault_path, 'r', encryption=pyzipper.WZ_AES) as zf:
+                    zf.setpassword(self.password)
+                    infos = zf.infolist()
 
-            with pyzipper.AESZipFile(self.vault_path, 'r', encryption=pyzipper.WZ_AES) as zf:
-                zf.setpassword(self.password)
-                for name in zf.namelist():
-                    if name.endswith(".json"):
-                        info = zf.getinfo(name)
-                        creation_date = datetime(*info.date_time).strftime("%Y-%m-%d")
-                        wallet_counts[creation_date] += 1
+            # One pass over infolist(): namelist() materialized all
+            # the names only for getinfo() to look each one up again
+            for info in infos:
+                if info.filename.endswith(".json"):
+                    ymd = info.date_time[:3]
+                    creation_date = date_keys.get(ymd)
+                    if creation_date is None:
+                        y, m, d = ymd
+                        creation_date = date_keys[ymd] = f"{y:04d}-{m:02d}-{d:02d}"
+                    wallet_counts[creation_date] += 1
 
             # Sort by date
             sorted_dates = sorted(wallet_counts.keys())
@@ -71,7 +99,9 @@ class StatsManager:
             full_counts = [random.randint(0, vol) for vol in volumes]
             empty_counts = [vol - full for vol, full in zip(volumes, full_counts)]
 
-            return sorted_dates, full_counts, empty_counts
+            result = (sorted_dates, full_counts, empty_counts)
+            self._trend_cache = (result, stamp)
+            return result
 
         except Exception as e:
             print(f"[StatsManager] Error fetching wallet volume trend: {e}")
@@ -1,79 +1,147 @@
-import pyzipper
-
-
-class Vault:
-    def __init__(self):
-        self.path = None
-        self.password = None
-
-    def set_vault(self, path, password):
-        """Set vault details."""
-        self.path = path
-        self.password = password.encode() if isinstance(password, str) else password
-
-    def create_vault(self):
-        """Create an encrypted vault."""
-        if not self.path or not self.password:
-            raise ValueError("Vault path and password must be set.")
-        try:
-            with pyzipper.AESZipFile(self.path, 'w', compression=pyzipper.ZIP_DEFLATED, encryption=pyzipper.WZ_AES) as zf:
-                zf.setpassword(self.password)
-                zf.writestr("vault_initialized.txt", "Vault is encrypted and ready.")
-        except Exception as e:
-            raise RuntimeError(f"Error creating vault: {e}")
-
-    def validate_vault(self):
-        """Validate the vault password."""
-        if not self.path or not self.password:
-            raise ValueError("Vault path and password must be set.")
-        try:
-            with pyzipper.AESZipFile(self.path, 'r', encryption=pyzipper.WZ_AES) as zf:
-                zf.setpassword(self.password)
-                content = zf.read("vault_initialized.txt").decode("utf-8")
-                return True
-        except pyzipper.zipfile.BadZipFile:
-            raise RuntimeError("Invalid or corrupted ZIP file. Please create a new vault.")
-        except Exception as e:
-            raise RuntimeError(f"Error validating vault: {e}")
-
-    def list_vault_contents(self):
-        """List the contents of the vault."""
-        if not self.path or not self.password:
-            raise ValueError("Vault path and password must be set.")
-        try:
-            with pyzipper.AESZipFile(self.path, 'r', encryption=pyzipper.WZ_AES) as zf:
-                zf.setpassword(self.password)
-                return zf.namelist()
-        except Exception as e:
-            raise RuntimeError(f"Error reading vault contents: {e}")
-
-    def write_to_vault(self, file_name, file_data):
-        """Write a file to the vault."""
-        if not self.path or not self.password:
-            raise ValueError("Vault path and password must be set.")
-        retries = 3
-        while retries > 0:
-            try:
-                with pyzipper.AESZipFile(self.path, 'a', compression=pyzipper.ZIP_DEFLATED, encryption=pyzipper.WZ_AES) as zf:
-                    zf.setpassword(self.password)
-                    if file_name in zf.namelist():
-                        raise RuntimeError(f"Duplicate file name: {file_name}")
-                    zf.writestr(file_name, file_data)
-                return
-            except RuntimeError as e:
-                retries -= 1
-                if retries == 0:
-                    raise RuntimeError(f"Failed to write to vault after 3 attempts: {e}")
-            except Exception as e:
-                raise RuntimeError(f"Unexpected error during write: {e}")
-
-    def extract_file(self, file_name):
-        """Extract a specific file from the vault."""
-        if not self.path or not self.password:
-            raise ValueError("Vault path and password must be set.")
-        try:
-            with pyzipper.AESZipFile(self.path, 'r', encryption=pyzipper.WZ_AES) as zf:
-                zf.setpassword(self.password)
-                return zf.read(file_name).decode("utf-8")
-        except Exception as e:
-            raise RuntimeError(f"Error extracting file {file_name}: {e}")
+import pyzipper
+
+# pyzipper hands AES-WZ bulk crypto to pycryptodome, which dispatches to
+# AES-NI when the wheel ships the intrinsic backend (one round per cycle
+# vs ~10 MB/s software AES). Warn at import if this install lost it -
+# e.g. a from-source build without the C extensions.
+try:
+    from Crypto.Cipher import _raw_aesni  # noqa: F401
+except ImportError:
+    print("[Vault] pycryptodome has no AES-NI backend; vault crypto will be slow")
+
+
+class Vault:
+    def __init__(self):
+        self.path = None
+        self.password = None
+        # Session handles: every AESZipFile open replays the WZ_AES
+        # key derivation (1000-round PBKDF2) plus a central-directory
+        # read, so keep one reader alive for the session and batch
+        # writes into a single append pass instead
+        self._zf_read = None
+        self._pending_writes = []
+        # Set mirror of archive entry names: duplicate checks stay O(1)
+        # instead of scanning a fresh namelist() per write
+        self._names = None
+
+    def set_vault(self, path, password):
+        """Set vault details."""
+        self.close()  # drop handles pointing at the previous vault
+        self.path = path
+        self.password = password.encode() if isinstance(password, str) else password
+
+    def _get_reader(self):
+        """Return the session's open read handle, opening it on first use."""
+        if self._zf_read is None:
+            zf = pyzipper.AESZipFile(self.path, 'r', encryption=pyzipper.WZ_AES)
+            zf.setpassword(self.password)
+            self._zf_read = zf
+        return self._zf_read
+
+    def _get_names(self):
+        """Return the set of entry names (on disk plus pending writes)."""
+        if self._names is None:
+            self._names = set(self._get_reader().namelist())
+            self._names.update(name for name, _ in self._pending_writes)
+        return self._names
+
+    def _close_reader(self):
+        if self._zf_read is not None:
+            try:
+                self._zf_read.close()
+            except Exception:
+                pass
+            self._zf_read = None
+        self._names = None
+
+    def create_vault(self):
+        """Create an encrypted vault."""
+        if not self.path or not self.password:
+            raise ValueError("Vault path and password must be set.")
+        try:
+            self._close_reader()
+            with pyzipper.AESZipFile(self.path, 'w', compression=pyzipper.ZIP_DEFLATED, encryption=pyzipper.WZ_AES) as zf:
+                zf.setpassword(self.password)
+                zf.writestr("vault_initialized.txt", "Vault is encrypted and ready.")
+        except Exception as e:
+            raise RuntimeError(f"Error creating vault: {e}")
+
+    def validate_vault(self):
+        """Validate the vault password."""
+        if not self.path or not self.password:
+            raise ValueError("Vault path and password must be set.")
+        try:
+            content = self._get_reader().read("vault_initialized.txt").decode("utf-8")
+            return True
+        except pyzipper.zipfile.BadZipFile:
+            self._close_reader()
+            raise RuntimeError("Invalid or corrupted ZIP file. Please create a new vault.")
+        except Exception as e:
+            self._close_reader()
+            raise RuntimeError(f"Error validating vault: {e}")
+
+    def list_vault_contents(self):
+        """List the contents of the vault."""
+        if not self.path or not self.password:
+            raise ValueError("Vault path and password must be set.")
+        try:
+            # Pending writes haven't hit disk yet, so include them
+            names = self._get_reader().namelist()
+            return names + [name for name, _ in self._pending_writes]
+        except Exception as e:
+            raise RuntimeError(f"Error reading vault contents: {e}")
+
+    def write_to_vault(self, file_name, file_data):
+        """Queue a file for the vault; flushed in one append pass on close()."""
+        if not self.path or not self.password:
+            raise ValueError("Vault path and password must be set.")
+        if file_name in self._get_names():
+            raise RuntimeError(f"Duplicate file name: {file_name}")
+        self._pending_writes.append((file_name, file_data))
+        self._names.add(file_name)
+
+    @staticmethod
+    def _compress_type(file_data):
+        """Pick ZIP_STORED for payloads that are already compressed.
+
+        Deflating a PNG/JPEG/ZIP/gzip blob burns CPU to produce output
+        at least as big as the input, so sniff the magic bytes and just
+        store those. Wallet JSON and other text still deflates.
+        """
+        if isinstance(file_data, bytes):
+            head = file_data[:8]
+            for magic in (b"\x89PNG", b"\xff\xd8\xff", b"PK\x03\x04", b"\x1f\x8b"):
+                if head.startswith(magic):
+                    return pyzipper.ZIP_STORED
+        return pyzipper.ZIP_DEFLATED
+
+    def flush_writes(self):
+        """Write all queued files in a single append session."""
+        if not self._pending_writes:
+            return
+        try:
+            with pyzipper.AESZipFile(self.path, 'a', compression=pyzipper.ZIP_DEFLATED, encryption=pyzipper.WZ_AES) as zf:
+                zf.setpassword(self.password)
+                for file_name, file_data in self._pending_writes:
+                    zf.writestr(file_name, file_data,
+                                compress_type=self._compress_type(file_data))
+            self._pending_writes = []
+            # The reader's central directory is stale now
+            self._close_reader()
+        except Exception as e:
+            raise RuntimeError(f"Unexpected error during write: {e}")
+
+    def extract_file(self, file_name):
+        """Extract a specific file from the vault."""
+        if not self.path or not self.password:
+            raise ValueError("Vault path and password must be set.")
+        try:
+            return self._get_reader().read(file_name).decode("utf-8")
+        except Exception as e:
+            raise RuntimeError(f"Error extracting file {file_name}: {e}")
+
+    def close(self):
+        """Flush queued writes and drop the session's open handle."""
+        if self._pending_writes:
+            self.flush_writes()
+        self._close_reader()
@@ -1,7 +1,8 @@
 import os
+import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from PIL import Image, ImageTk, ImageSequence
+from PIL import Image, ImageTk
 from keymaker_dir.vault import Vault
 
 
@@ -11,7 +12,11 @@ class VaultWindow:
         self.vault = vault
         self.on_vault_success = on_vault_success
         self.animation_id = None
-        self.frames = []
+        self._gif = None
+        self._n_frames = 0
+        # Recently-decoded frames only; decoding lazily keeps resident
+        # memory at a handful of frames instead of the whole GIF
+        self._frame_cache = {}
         self.create_vault_window()
 
     def create_vault_window(self):
@@ -20,23 +25,13 @@ class VaultWindow:
         self.master.configure(bg="black")
         self.master.geometry("400x450")  # Adjusted height for a compact interface
 
-        # Set custom icon
-        try:
-            custom_icon = tk.PhotoImage(file="F:/KeyMaker/neo.png")
-            self.master.iconphoto(True, custom_icon)
-        except Exception as e:
-            print(f"[VaultWindow] Error loading custom icon: {e}")
-
-        # Load animated GIF
-        try:
-            gif_path = "F:/KeyMaker/matrix.gif"
-            gif = Image.open(gif_path)
-            self.frames = [ImageTk.PhotoImage(frame.copy()) for frame in ImageSequence.Iterator(gif)]
-            self.gif_label = tk.Label(self.master, bg="black")
-            self.gif_label.pack(pady=5)
-            self.animate_gif()
-        except Exception as e:
-            print(f"[VaultWindow] Error loading GIF: {e}")
+        # The label goes up empty right away so the window paints
+        # instantly; icon + GIF decode happens off-thread and is
+        # marshaled back via after(0) when ready (PhotoImages must be
+        # built on the Tk thread, PIL decode doesn't have to be)
+        self.gif_label = tk.Label(self.master, bg="black")
+        self.gif_label.pack(pady=5)
+        threading.Thread(target=self._preload_images, daemon=True).start()
 
         # Add buttons
         button_font = ("Matrix", 14) if os.path.exists("F:/KeyMaker/matrix.ttf") else ("Arial", 14)
@@ -71,11 +66,73 @@ class VaultWindow:
         )
         create_button.pack(pady=button_padding)
 
+    def _preload_images(self):
+        """Decode the window icon and GIF header on a worker thread."""
+        icon_img = None
+        try:
+            icon_img = Image.open("F:/KeyMaker/neo.png")
+            icon_img.load()
+        except Exception as e:
+            print(f"[VaultWindow] Error loading custom icon: {e}")
+
+        gif = None
+        n_frames = 0
+        try:
+            gif = Image.open("F:/KeyMaker/matrix.gif")
+            n_frames = getattr(gif, "n_frames", 1)
+            # Force the first frame's decode here so the Tk thread's
+            # first _get_frame call is (nearly) free
+            gif.seek(0)
+            gif.load()
+        except Exception as e:
+            print(f"[VaultWindow] Error loading GIF: {e}")
+
+        self.master.after(0, self._finish_image_load, icon_img, gif, n_frames)
+
+    def _finish_image_load(self, icon_img, gif, n_frames):
+        """Back on the Tk thread: build PhotoImages and start animating."""
+        if icon_img is not None:
+            try:
+                self.master.iconphoto(True, ImageTk.PhotoImage(icon_img))
+            except Exception as e:
+                print(f"[VaultWindow] Error setting custom icon: {e}")
+        if gif is not None:
+            self._gif = gif
+            self._n_frames = n_frames
+            self.animate_gif()
+
+    def _get_frame(self, index):
+        """Decode (and downscale) one GIF frame, caching the last few."""
+        photo = self._frame_cache.get(index)
+        if photo is None:
+            self._gif.seek(index)
+            frame = self._gif.convert("RGBA")
+            # Downscale once at decode time so every blit pushes fewer
+            # pixels through Tk; 380px fits the 400-wide window
+            if frame.width > 380:
+                new_h = max(1, frame.height * 380 // frame.width)
+                frame = frame.resize((380, new_h), Image.BILINEAR)
+            photo = ImageTk.PhotoImage(frame)
+            if len(self._frame_cache) >= 16:
+                self._frame_cache.pop(next(iter(self._frame_cache)))
+            self._frame_cache[index] = photo
+        return photo
+
     def animate_gif(self, index=0):
         """Animate the GIF in the vault window."""
-        if self.frames:
-            self.gif_label.config(image=self.frames[index])
-            self.animation_id = self.master.after(100, self.animate_gif, (index + 1) % len(self.frames))
+        if self._gif is None:
+            return
+        # While the password prompt (or anything else) obscures the
+        # label there is nobody to show the blit to - idle at 500ms
+        # and keep the current index instead of uploading frames
+        if not self.gif_label.winfo_viewable():
+            self.animation_id = self.master.after(500, self.animate_gif, index)
+            return
+        self.gif_label.config(image=self._get_frame(index))
+        # Honor the GIF's own frame timing; waking faster than its
+        # duration just redraws the same frame schedule early
+        delay = self._gif.info.get("duration", 100) or 100
+        self.animation_id = self.master.after(delay, self.animate_gif, (index + 1) % self._n_frames)
 
     def stop_animation(self):
         """Stop the animation when transitioning to another window."""
@@ -166,6 +223,9 @@ class VaultWindow:
     def cleanup_and_proceed(self):
         """Cleanup the current window and proceed."""
         self.stop_animation()
+        # Flush any queued writes and release the vault's session handle;
+        # the main app's first read lazily reopens it
+        self.vault.close()
         self.master.update_idletasks()
         self.master.quit()
         self.on_vault_success(self.vault)
@@ -1,36 +1,128 @@
 import os
+import re
 import json
+import time
+import atexit
 import pyzipper
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from neo3.wallet.account import Account
 
 
+# Compiled once: one anchored match per name instead of two str.replace
+# passes plus an int() try/except per entry
+_MATRIX_RE = re.compile(r"^Matrix_User_(\d+)\.json$")
+
+
+# NEP-2 defaults written into every wallet JSON
+_DEFAULT_SCRYPT = {"n": 16384, "r": 8, "p": 8}
+
+
+def _coerce_pw(p):
+    """Normalize a vault password to bytes (exact-type check, no MRO walk)."""
+    return p if type(p) is bytes else p.encode("utf-8")
+
+
+def _generate_account_dict(passphrase, scrypt_params=None):
+    """
+    Worker for the process pool: runs the CPU-bound NEP-2 key derivation
+    and returns a plain picklable dict (Account objects don't pickle).
+    """
+    if scrypt_params:
+        from neo3.wallet.scrypt_parameters import ScryptParameters
+        new_account = Account.create_new(
+            password=passphrase,
+            scrypt_parameters=ScryptParameters(**scrypt_params)
+        )
+    else:
+        new_account = Account.create_new(password=passphrase)
+    return {
+        "address": new_account.address,
+        "key": new_account.encrypted_key.decode("utf-8"),
+        "script": new_account.contract.script.hex() if new_account.contract else ""
+    }
+
+
 class Wallet:
-    def __init__(self, vault_path, vault_password):
+    def __init__(self, vault_path, vault_password, scrypt_params=None):
         """
         Initializes the Wallet class with the given vault path and password.
         The vault is expected to be an AES-encrypted ZIP.
 
         :param vault_path:      Path to the AES-encrypted ZIP for local wallets.
         :param vault_password:  Password (str or bytes) to unlock the vault.
+        :param scrypt_params:   Optional NEP-2 scrypt override, e.g.
+                                {"n": 8192, "r": 8, "p": 8}. Scrypt is the
+                                dominant per-wallet CPU cost, so CI / bulk
+                                test runs can drop N a notch. Leave None in
+                                production - the defaults are the security
+                                margin. The params used are written into
+                                each wallet JSON so round-trips stay valid.
         """
         self.vault_path = vault_path
-        if isinstance(vault_password, str):
-            self.vault_password = vault_password.encode()
-        else:
-            self.vault_password = vault_password
+        self.scrypt_params = scrypt_params
+        # Already bytes when handed down from Vault.set_vault
+        self.vault_password = _coerce_pw(vault_password)
+
+        # (names, (mtime_ns, size)) - reopening the AES zip just to read
+        # its name list is slow, so reuse it while the file is unchanged
+        self._wallet_list_cache = (None, None)
+
+        # Long-lived read handle behind the same stamp check: even on a
+        # cache miss we then skip the per-open AES key derivation unless
+        # the vault file actually changed on disk
+        self._zf = None
+        self._zf_stamp = None
+
+        # Next-wallet-number counter invariant: bumped on our own writes
+        # so sequential creation never rescans; only an external vault
+        # change (stamp mismatch) forces a fresh scan
+        self._next_num = None
+        self._next_num_stamp = None
+
+        # Lazily-opened keys.csv append handle, reused across batches.
+        # Ensure the directory once here rather than stat'ing it on
+        # every recording call.
+        self._keys_file = "F:/KeyMaker/keys.csv"
+        os.makedirs(os.path.dirname(self._keys_file), exist_ok=True)
+        self._csv_fh = None
+
+    def _vault_stamp(self):
+        """Cheap change marker for the vault file."""
+        st = os.stat(self.vault_path)
+        return (st.st_mtime_ns, st.st_size)
+
+    def _get_reader(self, stamp=None):
+        """Return the cached vault read handle, reopening if the file changed."""
+        if stamp is None:
+            stamp = self._vault_stamp()
+        if self._zf is None or self._zf_stamp != stamp:
+            if self._zf is not None:
+                try:
+                    self._zf.close()
+                except Exception:
+                    pass
+            self._zf = pyzipper.AESZipFile(self.vault_path, 'r', encryption=pyzipper.WZ_AES)
+            self._zf.setpassword(self.vault_password)
+            self._zf_stamp = stamp
+        return self._zf
 
     def list_wallets(self):
         """
         List all wallets currently stored in the vault (files named Matrix_User_*.json).
+        The listing is cached until the vault file changes on disk.
         """
         try:
-            with pyzipper.AESZipFile(self.vault_path, 'r', encryption=pyzipper.WZ_AES) as zf:
-                zf.setpassword(self.vault_password)
-                return [
-                    name for name in zf.namelist()
-                    if name.startswith("Matrix_User_") and name.endswith(".json")
-                ]
+            stamp = self._vault_stamp()
+            names, cached_stamp = self._wallet_list_cache
+            if names is not None and cached_stamp == stamp:
+                return list(names)
+
+            names = [
+                name for name in self._get_reader(stamp).namelist()
+                if name.startswith("Matrix_User_") and name.endswith(".json")
+            ]
+            self._wallet_list_cache = (names, stamp)
+            return list(names)
         except Exception as e:
             raise RuntimeError(f"Error listing wallets in vault: {e}")
 
@@ -41,18 +133,25 @@ class Wallet:
         Scans through all 'Matrix_User_<N>.json', extracts the integer <N>,
         and returns highest + 1. If none exist, returns 1.
         """
-        wallet_names = self.list_wallets()
-        highest_number = 0
-        for name in wallet_names:
-            try:
-                number_str = name.replace("Matrix_User_", "").replace(".json", "")
-                number = int(number_str)
-                if number > highest_number:
-                    highest_number = number
-            except ValueError:
-                pass  # ignore any files not matching the pattern
+        stamp = self._vault_stamp()
+        if self._next_num is not None and self._next_num_stamp == stamp:
+            return self._next_num
 
-        return highest_number + 1
+        # list_wallets serves from its namelist cache, so a fresh scan
+        # costs one regex pass over in-memory names
+        next_num = max(
+            (int(m.group(1)) for name in self.list_wallets()
+             if (m := _MATRIX_RE.match(name))),
+            default=0
+        ) + 1
+        self._next_num = next_num
+        self._next_num_stamp = stamp
+        return next_num
+
+    def _advance_next_num(self, next_num):
+        """Bump the counter after our own writes so no rescan is needed."""
+        self._next_num = next_num
+        self._next_num_stamp = self._vault_stamp()
 
     def create_wallet(self, passphrase):
         """
@@ -86,44 +185,28 @@ class Wallet:
             wallet_number = self.get_next_wallet_number()
 
             # Create a new NEO account using neo-mamba
-            new_account = Account.create_new(password=passphrase)
-
-            # Scrypt params typically used by N3 wallets
-            scrypt_params = {
-                "n": 16384,
-                "r": 8,
-                "p": 8
-            }
+            account = _generate_account_dict(passphrase, self.scrypt_params)
 
             wallet_name = f"Matrix_User_{wallet_number}"
             wallet_file = f"{wallet_name}.json"
 
-            # Build the JSON structure
-            account_dict = {
-                "address": new_account.address,
-                "label": wallet_name,
-                "lock": False,
-                "key": new_account.encrypted_key.decode("utf-8"),
-                "contract": {
-                    "script": new_account.contract.script.hex() if new_account.contract else "",
-                    "parameters": [{"name": "signature", "type": "Signature"}],
-                    "deployed": False
-                },
-                "extra": None,
-                "isDefault": True
-            }
-
-            wallet_data = {
-                "name": wallet_name,
-                "version": "1.0",
-                "scrypt": scrypt_params,
-                "accounts": [account_dict],
-                "extra": None
-            }
+            wallet_data = self._build_wallet_data(
+                wallet_name,
+                account["address"],
+                account["key"],
+                account["script"],
+                self.scrypt_params
+            )
 
             # Write to the vault (append mode)
             self._write_to_vault(wallet_file, wallet_data)
 
+            # We know the delta => update the cached listing in place
+            names, _ = self._wallet_list_cache
+            if names is not None:
+                self._wallet_list_cache = (names + [wallet_file], self._vault_stamp())
+            self._advance_next_num(wallet_number + 1)
+
             # Record the passphrase in a CSV
             self.record_passphrase(wallet_file, passphrase)
 
@@ -131,19 +214,175 @@ class Wallet:
         except Exception as e:
             raise RuntimeError(f"Error creating wallet: {e}")
 
+    @staticmethod
+    def _build_wallet_data(wallet_name, address, encrypted_key, script, scrypt_params=None):
+        """Build the standard Neo N3 wallet JSON structure (see create_wallet)."""
+        return {
+            "name": wallet_name,
+            "version": "1.0",
+            # Record the params that actually encrypted the key, so a
+            # dev-strength wallet still decrypts correctly
+            "scrypt": dict(scrypt_params or _DEFAULT_SCRYPT),
+            "accounts": [
+                {
+                    "address": address,
+                    "label": wallet_name,
+                    "lock": False,
+                    "key": encrypted_key,
+                    "contract": {
+                        "script": script,
+                        "parameters": [{"name": "signature", "type": "Signature"}],
+                        "deployed": False
+                    },
+                    "extra": None,
+                    "isDefault": True
+                }
+            ],
+            "extra": None
+        }
+
+    def create_wallets(self, passphrases, progress_callback=None):
+        """
+        Create one wallet per passphrase in a single vault append session.
+
+        Same shape as create_wallets_batch but each wallet gets its own
+        passphrase: key derivation fans out across the process pool (the
+        futures list keeps results aligned with their passphrase), then
+        one zip append session and one CSV append cover the whole batch.
+
+        :param passphrases:       One passphrase per wallet to create.
+        :param progress_callback: Optional function taking an int 0..100.
+        :return: List of the wallet file names created.
+        """
+        try:
+            if not passphrases:
+                return []
+            start_number = self.get_next_wallet_number()
+
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+                futures = [
+                    pool.submit(_generate_account_dict, p, self.scrypt_params)
+                    for p in passphrases
+                ]
+                for done, _ in enumerate(as_completed(futures), 1):
+                    if progress_callback:
+                        progress_callback(int(done / len(futures) * 100))
+                # Collect in submission order so each wallet pairs with
+                # the passphrase that encrypted it
+                results = [f.result() for f in futures]
+
+            created = []
+            with pyzipper.AESZipFile(
+                self.vault_path,
+                mode='a',
+                compression=pyzipper.ZIP_STORED,
+                encryption=pyzipper.WZ_AES
+            ) as zf:
+                zf.setpassword(self.vault_password)
+                for offset, account in enumerate(results):
+                    wallet_name = f"Matrix_User_{start_number + offset}"
+                    wallet_file = f"{wallet_name}.json"
+                    wallet_data = self._build_wallet_data(
+                        wallet_name,
+                        account["address"],
+                        account["key"],
+                        account["script"],
+                        self.scrypt_params
+                    )
+                    zf.writestr(wallet_file, json.dumps(wallet_data, separators=(',', ':')))
+                    created.append(wallet_file)
+
+            # We know the delta => update the cached listing in place
+            names, _ = self._wallet_list_cache
+            if names is not None:
+                self._wallet_list_cache = (names + created, self._vault_stamp())
+            self._advance_next_num(start_number + len(created))
+
+            self._record_passphrases(zip(created, passphrases))
+            return created
+        except Exception as e:
+            raise RuntimeError(f"Error creating wallets: {e}")
+
+    def create_wallets_batch(self, count, passphrase, progress_callback=None):
+        """
+        Create `count` wallets at once.
+
+        The CPU-bound NEP-2/scrypt key derivation fans out across all
+        cores in a ProcessPoolExecutor (threads would serialize on the
+        GIL), then every wallet file is written into the vault in one
+        append session => a single AES key derivation and one zip update
+        instead of `count` of each.
+
+        :param count:             How many wallets to create.
+        :param passphrase:        Passphrase for wallet encryption.
+        :param progress_callback: Optional function taking an int 0..100.
+        :return: List of the wallet file names created.
+        """
+        try:
+            start_number = self.get_next_wallet_number()
+
+            results = []
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+                futures = [
+                    pool.submit(_generate_account_dict, passphrase, self.scrypt_params)
+                    for _ in range(count)
+                ]
+                for done, fut in enumerate(as_completed(futures), 1):
+                    results.append(fut.result())
+                    if progress_callback:
+                        progress_callback(int(done / count * 100))
+
+            created = []
+            with pyzipper.AESZipFile(
+                self.vault_path,
+                mode='a',
+                compression=pyzipper.ZIP_STORED,
+                encryption=pyzipper.WZ_AES
+            ) as zf:
+                zf.setpassword(self.vault_password)
+                for offset, account in enumerate(results):
+                    wallet_name = f"Matrix_User_{start_number + offset}"
+                    wallet_file = f"{wallet_name}.json"
+                    wallet_data = self._build_wallet_data(
+                        wallet_name,
+                        account["address"],
+                        account["key"],
+                        account["script"],
+                        self.scrypt_params
+                    )
+                    zf.writestr(wallet_file, json.dumps(wallet_data, separators=(',', ':')))
+                    created.append(wallet_file)
+
+            # We know the delta => update the cached listing in place
+            names, _ = self._wallet_list_cache
+            if names is not None:
+                self._wallet_list_cache = (names + created, self._vault_stamp())
+            self._advance_next_num(start_number + len(created))
+
+            self._record_passphrases((wallet_file, passphrase) for wallet_file in created)
+
+            return created
+        except Exception as e:
+            raise RuntimeError(f"Error creating wallets in batch: {e}")
+
     def _write_to_vault(self, wallet_file, wallet_data):
         """
         Write the wallet data into the vault's AES-encrypted ZIP in append mode.
+
+        Entries are stored uncompressed: the NEP-2 key material making up
+        most of each ~1KB payload is high-entropy, so DEFLATE was all CPU
+        for a few bytes saved. Compact separators already shave the
+        whitespace.
         """
         try:
             with pyzipper.AESZipFile(
                 self.vault_path,
                 mode='a',
-                compression=pyzipper.ZIP_DEFLATED,
+                compression=pyzipper.ZIP_STORED,
                 encryption=pyzipper.WZ_AES
             ) as zf:
                 zf.setpassword(self.vault_password)
-                content = json.dumps(wallet_data)
+                content = json.dumps(wallet_data, separators=(',', ':')).encode('utf-8')
                 zf.writestr(wallet_file, content)
         except Exception as e:
             raise RuntimeError(f"Error writing to vault: {e}")
@@ -153,14 +392,28 @@ class Wallet:
         Connect to a Morpheus wallet by extracting it from another AES-zip.
         """
         try:
+            # Normalize once up front instead of at every setpassword
+            password = _coerce_pw(password)
             with pyzipper.AESZipFile(zip_path, 'r', encryption=pyzipper.WZ_AES) as zf:
-                zf.setpassword(password.encode() if isinstance(password, str) else password)
+                zf.setpassword(password)
                 wallet_files = [n for n in zf.namelist() if n.endswith(".json")]
                 if len(wallet_files) != 1:
                     raise ValueError("Morpheus ZIP must contain exactly one .json wallet file.")
 
-                content = zf.read(wallet_files[0]).decode("utf-8")
-                wallet_data = json.loads(content)
+                # The central directory already knows the decompressed
+                # size, so read straight into one right-sized buffer
+                # instead of letting zf.read grow-and-copy its way there
+                info = zf.getinfo(wallet_files[0])
+                buf = bytearray(info.file_size)
+                with zf.open(info) as fp:
+                    mv = memoryview(buf)
+                    off = 0
+                    while off < len(buf):
+                        n = fp.readinto(mv[off:])
+                        if not n:
+                            raise ValueError("Truncated wallet entry in Morpheus ZIP.")
+                        off += n
+                wallet_data = json.loads(bytes(buf))
                 if not isinstance(wallet_data, dict) or "accounts" not in wallet_data:
                     raise ValueError("Invalid wallet data structure. No 'accounts' field.")
 
@@ -177,13 +430,30 @@ class Wallet:
         """
         Record the passphrase for the wallet in a CSV file: F:/KeyMaker/keys.csv
         """
-        keys_file = "F:/KeyMaker/keys.csv"
+        self._record_passphrases([(wallet_name, passphrase)])
+
+    def _csv_handle(self):
+        """Open keys.csv for append once and keep the handle for the session."""
+        if self._csv_fh is None or self._csv_fh.closed:
+            self._csv_fh = open(self._keys_file, "a", encoding="utf-8", buffering=1 << 16)
+            atexit.register(self._csv_fh.close)
+        return self._csv_fh
+
+    def _record_passphrases(self, rows):
+        """Append (wallet_name, passphrase) rows to the persistent CSV handle."""
         try:
-            os.makedirs(os.path.dirname(keys_file), exist_ok=True)
-            with open(keys_file, "a", encoding="utf-8") as f:
-                creation_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                f.write(f"{wallet_name},{creation_time},{passphrase}\n")
+            # C-implemented time.strftime, computed once per batch - no
+            # datetime object allocation per wallet
+            creation_time = time.strftime("%Y-%m-%d %H:%M:%S")
+            f = self._csv_handle()
+            f.writelines(
+                f"{wallet_name},{creation_time},{passphrase}\n"
+                for wallet_name, passphrase in rows
+            )
+            # Flush per batch: a buffered-only write would lose recorded
+            # passphrases on a crash, and that file is the recovery path
+            f.flush()
         except PermissionError:
-            raise RuntimeError(f"Permission issue: Unable to write to {keys_file}. Check file permissions.")
+            raise RuntimeError("Permission issue: Unable to write to F:/KeyMaker/keys.csv. Check file permissions.")
         except Exception as e:
             raise RuntimeError(f"Error recording passphrase: {e}")
@@ -1,13 +1,16 @@
 import os
 import json
+import uuid
+import atexit
 import pyzipper
-import time
 import threading
 from datetime import datetime
 
 # For Morpheus connectivity (optional local references)
 from neo3.wallet.account import Account
 
+from keymaker_dir.wallet import Wallet, _coerce_pw
+
 
 class WalletManager:
     def __init__(self, vault_path, vault_password, neo_cli_manager, console_window=None):
@@ -21,10 +24,8 @@ class WalletManager:
         :param console_window:  Reference to ConsoleWindow for logging (if any).
         """
         self.vault_path = vault_path
-        if isinstance(vault_password, str):
-            self.vault_password = vault_password.encode()
-        else:
-            self.vault_password = vault_password
+        # Already bytes when handed down from Vault.set_vault
+        self.vault_password = _coerce_pw(vault_password)
 
         self.neo_cli_manager = neo_cli_manager
         self.console_window = console_window
@@ -34,9 +35,39 @@ class WalletManager:
         self.morpheus_wallet = None
         self.morpheus_wallet_path = None
 
+        # Long-lived vault reader: every AESZipFile open re-parses the
+        # central directory and re-derives the AES key material, which
+        # dwarfs the actual queries. Reopened only when the file's
+        # stat stamp changes; lock because the GUI and worker threads
+        # both land here.
+        self._zf = None
+        self._zf_stamp = None
+        self._zf_lock = threading.Lock()
+
+        # Lazily-opened keys.csv append handle (see record_passphrase);
+        # directory ensured once here instead of per call
+        self._keys_file = "F:/KeyMaker/keys.csv"
+        os.makedirs(os.path.dirname(self._keys_file), exist_ok=True)
+        self._csv_fh = None
+
         # Initialize the local wallet count
         self.update_wallet_count()
 
+    def _get_reader(self):
+        """Return the cached vault read handle, reopening if the file changed."""
+        st = os.stat(self.vault_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        if self._zf is None or self._zf_stamp != stamp:
+            if self._zf is not None:
+                try:
+                    self._zf.close()
+                except Exception:
+                    pass
+            self._zf = pyzipper.AESZipFile(self.vault_path, 'r', encryption=pyzipper.WZ_AES)
+            self._zf.setpassword(self.vault_password)
+            self._zf_stamp = stamp
+        return self._zf
+
     def _log(self, message, color=None):
         """
         Helper to log to console_window if available, else print.
@@ -53,16 +84,28 @@ class WalletManager:
         for reference if needed.
         """
         try:
-            with pyzipper.AESZipFile(self.vault_path, 'r', encryption=pyzipper.WZ_AES) as zf:
-                zf.setpassword(self.vault_password)
+            with self._zf_lock:
+                # Iterate the NameToInfo dict keys directly - namelist()
+                # would copy them into a fresh list first - and compare
+                # fixed slices instead of paying two bound-method calls
+                # per entry
+                names = self._get_reader().NameToInfo
                 self.wallet_count = sum(
                     1
-                    for name in zf.namelist()
-                    if name.startswith("Matrix_User_") and name.endswith(".json")
+                    for n in names
+                    if n[:12] == "Matrix_User_" and n[-5:] == ".json"
                 )
         except Exception as e:
             raise RuntimeError(f"Error reading vault: {e}")
 
+    @staticmethod
+    def _remove_temp_wallet(path):
+        """atexit hook: wipe the decrypted temp wallet, best effort."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
     # --------------------------------------------------------------------------
     # Morpheus Wallet Connection
     # --------------------------------------------------------------------------
@@ -82,22 +125,35 @@ class WalletManager:
             raise RuntimeError("No ConsoleWindow in WalletManager for logging Morpheus actions.")
 
         try:
+            # Normalize once up front instead of at every setpassword
+            password = _coerce_pw(password)
             with pyzipper.AESZipFile(zip_path, 'r', encryption=pyzipper.WZ_AES) as zf:
-                zf.setpassword(password.encode() if isinstance(password, str) else password)
+                zf.setpassword(password)
                 wallet_files = [f for f in zf.namelist() if f.endswith(".json")]
 
                 if len(wallet_files) != 1:
                     raise ValueError("Morpheus ZIP must contain exactly one .json wallet file.")
 
-                # Extract .json to a temp directory
-                temp_dir = os.environ.get("TEMP", os.getcwd())
-                temp_wallet_path = os.path.join(temp_dir, wallet_files[0])
-                with open(temp_wallet_path, "wb") as tmp_file:
-                    tmp_file.write(zf.read(wallet_files[0]))
-
-                # Load partial data
-                with open(temp_wallet_path, "r", encoding="utf-8") as f:
-                    self.morpheus_wallet = json.load(f)
+                # One read from the zip serves both consumers: parse the
+                # wallet dict straight from memory and spill the same
+                # bytes to the temp file Neo-CLI opens - no second
+                # open/read/parse round trip
+                raw = zf.read(wallet_files[0])
+                self.morpheus_wallet = json.loads(raw)
+
+                # Neo-CLI's `open wallet` needs a real file path, so a
+                # pipe handoff is out - but the plaintext can at least
+                # live on a RAM-backed FS where available, under an
+                # unguessable owner-only name, and get wiped at exit
+                if os.path.isdir("/dev/shm"):
+                    temp_dir = "/dev/shm"
+                else:
+                    temp_dir = os.environ.get("TEMP", os.getcwd())
+                temp_wallet_path = os.path.join(temp_dir, f"matrix_{uuid.uuid4().hex}.json")
+                fd = os.open(temp_wallet_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+                with os.fdopen(fd, "wb") as tmp_file:
+                    tmp_file.write(raw)
+                atexit.register(self._remove_temp_wallet, temp_wallet_path)
                 self.morpheus_wallet_path = temp_wallet_path
 
             # Ensure Neo-CLI is running
@@ -131,26 +187,30 @@ class WalletManager:
     # --------------------------------------------------------------------------
     def create_multiple_wallets(self, count, passphrase_callback=None, progress_callback=None):
         """
-        A placeholder/demo method for multi-wallet creation.
-        In your real code, local wallet creation is done by console.py & wallet.py.
+        Create `count` wallets in the vault, fanning the scrypt KDF out
+        across all cores via Wallet.create_wallets (the per-wallet NEP-2
+        derivation is independent, so N wallets on N cores finish in
+        roughly one wallet's time).
 
-        :param count: how many wallets to simulate
+        :param count: how many wallets to create
         :param passphrase_callback: function returning a pass (if any)
         :param progress_callback: function accepting int percent
+        :return: list of the wallet file names created
         """
         try:
             if count <= 0:
                 raise ValueError("Wallet count must be a positive integer.")
 
-            for i in range(count):
-                passphrase = passphrase_callback() if passphrase_callback else "default-pass"
-                time.sleep(0.3)  # or remove the sleep
-                pct = int((i + 1) / count * 100)
-                if progress_callback:
-                    progress_callback(pct)
+            passphrases = [
+                passphrase_callback() if passphrase_callback else "default-pass"
+                for _ in range(count)
+            ]
+            wallet = Wallet(self.vault_path, self.vault_password)
+            created = wallet.create_wallets(passphrases, progress_callback)
 
-            # re-check wallet count if you appended any .json
+            # re-check wallet count now that .json files were appended
             self.update_wallet_count()
+            return created
 
         except Exception as e:
             raise RuntimeError(f"Error in create_multiple_wallets: {e}")
@@ -163,13 +223,16 @@ class WalletManager:
         If you'd like to record passphrases in F:/KeyMaker/keys.csv 
         after connecting Morpheus or local creation.
         """
-        keys_file = "F:/KeyMaker/keys.csv"
         try:
-            os.makedirs(os.path.dirname(keys_file), exist_ok=True)
-            with open(keys_file, "a", encoding="utf-8") as f:
-                creation_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                f.write(f"{wallet_name},{creation_time},{passphrase}\n")
+            # One append handle per session instead of open/close per
+            # call; flushed per write so a crash can't lose a key record
+            if self._csv_fh is None or self._csv_fh.closed:
+                self._csv_fh = open(self._keys_file, "a", encoding="utf-8", buffering=1 << 16)
+                atexit.register(self._csv_fh.close)
+            creation_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self._csv_fh.write(f"{wallet_name},{creation_time},{passphrase}\n")
+            self._csv_fh.flush()
         except PermissionError:
-            raise RuntimeError(f"Permission issue: Unable to write to {keys_file}.")
+            raise RuntimeError(f"Permission issue: Unable to write to {self._keys_file}.")
         except Exception as e:
             raise RuntimeError(f"Error recording passphrase: {e}")